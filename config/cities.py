@@ -1,4 +1,7 @@
 """config/cities.py — US states top 3 cities + categories."""
+import sys
+from typing import Dict, Tuple
+
 US_STATES_CITIES = {
     "Alabama":["Birmingham","Montgomery","Huntsville"],"Alaska":["Anchorage","Fairbanks","Juneau"],
     "Arizona":["Phoenix","Tucson","Mesa"],"Arkansas":["Little Rock","Fort Smith","Fayetteville"],
@@ -33,3 +36,25 @@ CATEGORY_SEARCH_TERMS = {
     "gaming":["gaming","gamer","gameplay","let's play","game review","video game","streamer"],
     "culture_entertainment":["vlog","lifestyle","culture","entertainment","comedy","podcast","pop culture"],
 }
+
+# Freeze at import: tuples are immutable/shareable, interned strings compare by pointer
+US_STATES_CITIES = {sys.intern(k): tuple(sys.intern(c) for c in v) for k, v in US_STATES_CITIES.items()}
+CATEGORIES = tuple(sys.intern(c) for c in CATEGORIES)
+CATEGORY_LABELS = {sys.intern(k): sys.intern(v) for k, v in CATEGORY_LABELS.items()}
+CATEGORY_SEARCH_TERMS = {sys.intern(k): tuple(sys.intern(t) for t in v) for k, v in CATEGORY_SEARCH_TERMS.items()}
+# Validation paths should test `cat in CATEGORIES_SET`; terms are aligned with CATEGORIES order
+CATEGORIES_SET: frozenset = frozenset(CATEGORIES)
+CATEGORY_TERMS_FLAT: Tuple[Tuple[str, ...], ...] = tuple(CATEGORY_SEARCH_TERMS[c] for c in CATEGORIES)
+
+# Reverse index: city -> states (some names exist in several states, e.g. Springfield, Portland)
+_city_to_states: Dict[str, list] = {}
+for _state, _cities in US_STATES_CITIES.items():
+    for _city in _cities:
+        _city_to_states.setdefault(_city, []).append(_state)
+CITY_TO_STATES: Dict[str, Tuple[str, ...]] = {c: tuple(s) for c, s in _city_to_states.items()}
+ALL_CITIES: Tuple[Tuple[str, str], ...] = tuple((c, s) for s, cs in US_STATES_CITIES.items() for c in cs)
+del _city_to_states, _state, _cities, _city
+
+# Every (state, city, category) task of a full scan, in scan order
+TASK_PLAN: Tuple[Tuple[str, str, str], ...] = tuple(
+    (s, c, cat) for s, cs in US_STATES_CITIES.items() for c in cs for cat in CATEGORIES)
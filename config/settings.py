@@ -1,4 +1,5 @@
 """config/settings.py — All constants, single source of truth."""
+import sys
 from pathlib import Path
 BASE_DIR = Path(__file__).parent.parent.resolve()
 WEB_PORT = 8080
@@ -13,6 +14,13 @@ MAX_WAVES = 3
 PAGES_PER_QUERY = 2
 MAX_PAGES_TO_FETCH = 25
 MIN_TRIAGE_SCORE = 4
+SEARCH_ENGINE_EARLY_STOP = 3  # YouTube URLs found on Brave for one query before Google is skipped
+CSV_GZIP_ROWS = 5000  # result CSVs with more rows are written as .csv.gz (gzip level 1)
+SAVE_INTERVAL_S = 30  # min seconds between full results.json snapshots (results.jsonl is appended per state)
+STATE_CONCURRENCY = 3  # states processed at once in auto mode (each runs its own browser)
+FETCH_CONCURRENCY = 8  # Phase 4 pages fetched+extracted in parallel (rate limiter still spaces requests)
+LLM_CONCURRENCY = 4  # verification prompts in flight to llama-server at once
+VERIFY_CONCURRENCY = 6  # Phase 6 YouTube checks in flight at once (keep low: YouTube rate-limits)
 SUB_MIN = 20_000
 SUB_MAX = 150_000
 MIN_CITY_SCORE = 0.4
@@ -24,8 +32,16 @@ RATE_MIN = 3.0
 RATE_MAX = 6.0
 RATE_DOMAIN = 8.0
 RATE_BRAVE = 12.0  # Brave Search needs more spacing
-PENDING = "pending"
-IN_PROGRESS = "in_progress"
-RESOLVED = "resolved"
-PARTIAL = "partial"
-FAILED = "failed"
+# Browser stealth jitter (lo, hi) seconds: between result pages, after each engine, after each query, between follow-ups
+JITTER_PAGE = (3.0, 7.0)
+JITTER_ENGINE = (4.0, 9.0)
+JITTER_QUERY = (5.0, 12.0)
+JITTER_FOLLOWUP = (3.0, 6.0)
+LOG_DEBUG = True  # per-candidate detail lines (Phase 6 checks/scoring); False skips even their formatting
+USE_SELECTOR_LOOP = False  # Windows only: Selector loop for HTTP-only runs (breaks Playwright browser)
+# Status sentinels are interned so models can compare them by identity
+PENDING = sys.intern("pending")
+IN_PROGRESS = sys.intern("in_progress")
+RESOLVED = sys.intern("resolved")
+PARTIAL = sys.intern("partial")
+FAILED = sys.intern("failed")
@@ -1,7 +1,7 @@
 """config/strategy.py — Load and parse the research strategy file.
 
 The strategy file defines steps for the LLM to follow when searching.
-Users can edit strategy.txt at any time — it's reloaded for each city.
+Users can edit strategy.txt at any time — it's reloaded whenever it changes on disk.
 """
 import re
 from pathlib import Path
@@ -11,6 +11,11 @@ from config.settings import BASE_DIR
 
 STRATEGY_FILE = BASE_DIR / "strategy.txt"
 
+# Compiled once at import — parse_steps/get_objective run once per city per wave
+_ETAPE_RE = re.compile(r'\[ETAPE\s+(\d+)\s*[—-]\s*([^\]]+)\](.*?)(?=\[ETAPE|\[NOTES\]|$)',
+                       re.DOTALL | re.IGNORECASE)
+_OBJECTIF_RE = re.compile(r'\[OBJECTIF\]\s*(.*?)(?=\[ETAPE|\[NOTES\]|$)', re.DOTALL)
+
 DEFAULT_STRATEGY = """[OBJECTIF]
 Trouver des chaines YouTube actives de createurs bases a {city}, {state} 
 dans la categorie {cat_label}, avec {sub_min} a {sub_max} abonnes.
@@ -27,11 +32,27 @@ Requetes a formuler:
 """
 
 
+# Strategy text, reused until strategy.txt changes on disk (mtime + size)
+_STRATEGY_CACHE = {"mtime": None, "size": None, "text": None}
+
+
 def load_strategy() -> str:
-    """Load strategy from file, or return default."""
-    if STRATEGY_FILE.exists():
+    """Load strategy from file, or return default.
+
+    The file is only re-read when its mtime or size changes.
+    """
+    try:
+        st = STRATEGY_FILE.stat()
+    except OSError:
+        st = None
+    if st is not None:
+        if (_STRATEGY_CACHE["text"] is not None and _STRATEGY_CACHE["mtime"] == st.st_mtime
+                and _STRATEGY_CACHE["size"] == st.st_size):
+            return _STRATEGY_CACHE["text"]
         try:
-            return STRATEGY_FILE.read_text(encoding='utf-8')
+            text = STRATEGY_FILE.read_text(encoding='utf-8')
+            _STRATEGY_CACHE.update(mtime=st.st_mtime, size=st.st_size, text=text)
+            return text
         except Exception:
             pass
     return DEFAULT_STRATEGY
@@ -40,6 +61,7 @@ def load_strategy() -> str:
 def save_strategy(text: str):
     """Save strategy text to file."""
     STRATEGY_FILE.write_text(text, encoding='utf-8')
+    _STRATEGY_CACHE["mtime"] = _STRATEGY_CACHE["size"] = _STRATEGY_CACHE["text"] = None
 
 
 def parse_steps(strategy_text: str) -> List[Dict]:
@@ -49,20 +71,20 @@ def parse_steps(strategy_text: str) -> List[Dict]:
     """
     steps = []
     # Split by [ETAPE N — Name]
-    pattern = r'\[ETAPE\s+(\d+)\s*[—-]\s*([^\]]+)\](.*?)(?=\[ETAPE|\[NOTES\]|$)'
-    for m in re.finditer(pattern, strategy_text, re.DOTALL | re.IGNORECASE):
+    for m in _ETAPE_RE.finditer(strategy_text):
         num = int(m.group(1))
         name = m.group(2).strip()
         body = m.group(3).strip()
         
         # Extract query templates (lines starting with -)
         queries = []
-        for line in body.split('\n'):
-            line = line.strip()
-            if line.startswith('- '):
-                q = line[2:].strip().strip('"').strip("'")
-                if q:
-                    queries.append(q)
+        for line in body.splitlines():
+            line = line.lstrip()
+            if not line.startswith('- '):
+                continue
+            q = line[2:].strip().strip('"').strip("'")
+            if q:
+                queries.append(q)
         
         steps.append({
             "number": num,
@@ -76,7 +98,7 @@ def parse_steps(strategy_text: str) -> List[Dict]:
 
 def get_objective(strategy_text: str) -> str:
     """Extract the [OBJECTIF] section."""
-    m = re.search(r'\[OBJECTIF\]\s*(.*?)(?=\[ETAPE|\[NOTES\]|$)', strategy_text, re.DOTALL)
+    m = _OBJECTIF_RE.search(strategy_text)
     return m.group(1).strip() if m else ""
 
 
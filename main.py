@@ -3,26 +3,31 @@
 main.py — YouTube Scout v2 entry point.
 Imports server and starts it. Zero logic here.
 """
-import sys, platform
+import sys
 
-if platform.system() == "Windows":
+if sys.platform == "win32":
     try:
         sys.stdout.reconfigure(encoding='utf-8', errors='replace')
         sys.stderr.reconfigure(encoding='utf-8', errors='replace')
     except Exception: pass
-    import asyncio
-    if sys.version_info >= (3, 8):
-        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    # Proactor is already the default loop on 3.8+ (and Playwright needs it for subprocesses)
+    from config.settings import USE_SELECTOR_LOOP
+    if USE_SELECTOR_LOOP:
+        import asyncio
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
-from server.server import create_app, WEB_PORT
-from aiohttp import web
+from config.settings import WEB_PORT
 
 def main():
+    import platform
     print("=" * 60)
     print("  YouTube Scout v2 — Intelligent Channel Finder")
     print(f"  Interface: http://localhost:{WEB_PORT}")
     print(f"  Platform:  {platform.system()} {platform.release()}")
     print("=" * 60)
+    # Heavy imports (aiohttp, pipeline, server routes) only once we actually serve
+    from aiohttp import web
+    from server.server import create_app
     web.run_app(create_app(), host="0.0.0.0", port=WEB_PORT)
 
 if __name__ == "__main__":
@@ -1,17 +1,26 @@
 """models/data_models.py — Fragment, ChannelCandidate, Resolution states."""
-import time
-from dataclasses import dataclass, field, asdict
+import sys, time
+from dataclasses import dataclass, field
 from typing import Optional, Dict
 from config.settings import PENDING, RESOLVED, FAILED
 
-@dataclass
+# __slots__ storage (3.10+): these are allocated per state x city x category x fragment
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+_now = time.time
+
+@dataclass(**_SLOTS)
 class Fragment:
     fragment_type: str = ""; value: str = ""; source_url: str = ""; source_type: str = ""
     context: str = ""; search_query: str = ""; search_wave: int = 1
-    timestamp: float = field(default_factory=time.time)
-    def to_dict(self): return asdict(self)
+    timestamp: float = 0.0
+    def __post_init__(self):
+        if not self.timestamp: self.timestamp = _now()
+    def to_dict(self):
+        return {"fragment_type":self.fragment_type,"value":self.value,"source_url":self.source_url,
+            "source_type":self.source_type,"context":self.context,"search_query":self.search_query,
+            "search_wave":self.search_wave,"timestamp":self.timestamp}
 
-@dataclass
+@dataclass(**_SLOTS)
 class ChannelCandidate:
     candidate_id: str = ""; channel_name: str = ""; channel_url: str = ""
     alternative_names: list = field(default_factory=list)
@@ -25,11 +34,35 @@ class ChannelCandidate:
     yt_last_upload_text: str = ""; yt_last_upload_recent: bool = False; yt_description: str = ""
     total_score: float = 0.0; verified: bool = False
     rejection_reasons: list = field(default_factory=list)
-    def to_dict(self): return asdict(self)
+    # Distinct fragment source URLs, kept in sync by add_fragment (not serialized)
+    _source_urls: set = field(default_factory=set, init=False, repr=False, compare=False)
+    _city_evidence_len_cached: int = field(default=-1, init=False, repr=False, compare=False)
+    # Explicit dict instead of asdict(): shallow list copies, no recursive deepcopy of fragments
+    def to_dict(self):
+        return {"candidate_id":self.candidate_id,"channel_name":self.channel_name,"channel_url":self.channel_url,
+            "alternative_names":list(self.alternative_names),"target_city":self.target_city,
+            "target_state":self.target_state,"target_category":self.target_category,
+            "fragments":list(self.fragments),"fragment_count":self.fragment_count,
+            "independent_sources":self.independent_sources,
+            "city_evidence":list(self.city_evidence),"city_score":self.city_score,
+            "category_evidence":list(self.category_evidence),"category_score":self.category_score,
+            "yt_verified":self.yt_verified,"yt_exists":self.yt_exists,"yt_real_name":self.yt_real_name,
+            "yt_subscribers_text":self.yt_subscribers_text,"yt_subscribers_count":self.yt_subscribers_count,
+            "yt_subscriber_match":self.yt_subscriber_match,"yt_last_upload_text":self.yt_last_upload_text,
+            "yt_last_upload_recent":self.yt_last_upload_recent,"yt_description":self.yt_description,
+            "total_score":self.total_score,"verified":self.verified,
+            "rejection_reasons":list(self.rejection_reasons)}
+    def __post_init__(self):
+        self._source_urls = {f["source_url"] for f in self.fragments if f.get("source_url")}
     def add_fragment(self, frag: Fragment):
-        self.fragments.append(frag.to_dict()); self.fragment_count = len(self.fragments)
-        self.independent_sources = len(set(f["source_url"] for f in self.fragments if f.get("source_url")))
+        d = frag.to_dict(); self.fragments.append(d); self.fragment_count = len(self.fragments)
+        if d["source_url"]: self._source_urls.add(d["source_url"])
+        self.independent_sources = len(self._source_urls)
     def compute_city_score(self):
+        # Only recompute when evidence was appended since the last call
+        n = len(self.city_evidence)
+        if n == self._city_evidence_len_cached: return
+        self._city_evidence_len_cached = n
         if not self.city_evidence: self.city_score = 0.0; return
         srcs = set(e.get("source_url","") for e in self.city_evidence if isinstance(e,dict) and e.get("source_url"))
         self.city_score = min(0.95, 0.3 + len(srcs)*0.2) if srcs else 0.15
@@ -42,33 +75,73 @@ class ChannelCandidate:
             + 0.20*(1.0 if self.yt_last_upload_recent else 0.0)
             + 0.10*min(1.0, self.independent_sources/3.0), 3)
 
-@dataclass
+def _track(counts: Dict[str,int], cat: "CategoryResolution"):
+    cat._counters.append(counts); counts[cat.status] = counts.get(cat.status, 0) + 1
+
+@dataclass(**_SLOTS)
 class CategoryResolution:
     category: str = ""; status: str = PENDING; waves_attempted: int = 0
     candidates: list = field(default_factory=list); best_candidate: Optional[dict] = None
     failure_reason: str = ""; search_log: list = field(default_factory=list)
-    def to_dict(self): return asdict(self)
+    # Status-count dicts of the owning City/StateResolution, updated by set_status
+    _counters: list = field(default_factory=list, init=False, repr=False, compare=False)
+    def __post_init__(self): self.status = sys.intern(self.status)
+    def set_status(self, status: str):
+        old = self.status; status = sys.intern(status)
+        if status is old: return
+        for counts in self._counters:
+            counts[old] -= 1; counts[status] = counts.get(status, 0) + 1
+        self.status = status
+    def to_dict(self):
+        return {"category":self.category,"status":self.status,"waves_attempted":self.waves_attempted,
+            "candidates":list(self.candidates),"best_candidate":self.best_candidate,
+            "failure_reason":self.failure_reason,"search_log":list(self.search_log)}
 
-@dataclass
+# City/State keep per-status category counts so summary()/is_resolved() don't walk every
+# CategoryResolution. Category statuses must change through CategoryResolution.set_status().
+@dataclass(**_SLOTS)
 class CityResolution:
     city: str = ""; state: str = ""; status: str = PENDING
     categories: Dict[str,CategoryResolution] = field(default_factory=dict)
     collected_fragments: list = field(default_factory=list)
     cross_city_fragments: list = field(default_factory=list)
-    def is_resolved(self): return all(c.status==RESOLVED for c in self.categories.values())
-    def is_fully_attempted(self): return all(c.status in (RESOLVED,FAILED) for c in self.categories.values())
-    def summary(self): return f"{sum(1 for c in self.categories.values() if c.status==RESOLVED)}/{len(self.categories)}"
+    _cat_status_counts: Dict[str,int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    def __post_init__(self):
+        for c in self.categories.values(): _track(self._cat_status_counts, c)
+    def add_category(self, cat: CategoryResolution):
+        self.categories[cat.category] = cat; _track(self._cat_status_counts, cat)
+    def is_resolved(self): return self._cat_status_counts.get(RESOLVED, 0) == len(self.categories)
+    def is_fully_attempted(self):
+        n = self._cat_status_counts
+        return n.get(RESOLVED, 0) + n.get(FAILED, 0) == len(self.categories)
+    def summary(self): return f"{self._cat_status_counts.get(RESOLVED, 0)}/{len(self.categories)}"
     def to_dict(self): return {"city":self.city,"state":self.state,"status":self.status,
         "categories":{k:v.to_dict() for k,v in self.categories.items()},"summary":self.summary()}
 
-@dataclass
+@dataclass(**_SLOTS)
 class StateResolution:
     state: str = ""; status: str = PENDING
     cities: Dict[str,CityResolution] = field(default_factory=dict)
-    def is_resolved(self): return all(c.is_fully_attempted() for c in self.cities.values())
+    _cat_status_counts: Dict[str,int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _cat_total: int = field(default=0, init=False, repr=False, compare=False)
+    def __post_init__(self):
+        for c in self.cities.values(): self._track_city(c)
+    def _track_city(self, city: CityResolution):
+        for cat in city.categories.values(): _track(self._cat_status_counts, cat)
+        self._cat_total += len(city.categories)
+    def add_city(self, city: CityResolution):
+        """Register a city; its categories must already be added."""
+        self.cities[city.city] = city; self._track_city(city)
+    def status_counts(self) -> Dict[str,int]: return dict(self._cat_status_counts)
+    def is_resolved(self):
+        n = self._cat_status_counts
+        return n.get(RESOLVED, 0) + n.get(FAILED, 0) == self._cat_total
     def summary(self):
-        t=sum(len(c.categories) for c in self.cities.values())
-        ok=sum(1 for c in self.cities.values() for cat in c.categories.values() if cat.status==RESOLVED)
-        return {"total":t,"resolved":ok,"cities":{n:c.summary() for n,c in self.cities.items()}}
-    def to_dict(self): return {"state":self.state,"status":self.status,
-        "cities":{k:v.to_dict() for k,v in self.cities.items()},"summary":self.summary()}
+        return {"total":self._cat_total,"resolved":self._cat_status_counts.get(RESOLVED, 0),
+            "cities":{n:c.summary() for n,c in self.cities.items()}}
+    def to_dict(self):
+        # Single pass: the per-city summaries come from the city dicts already built
+        cities = {k:v.to_dict() for k,v in self.cities.items()}
+        return {"state":self.state,"status":self.status,"cities":cities,
+            "summary":{"total":self._cat_total,"resolved":self._cat_status_counts.get(RESOLVED, 0),
+                "cities":{k:d["summary"] for k,d in cities.items()}}}
@@ -19,23 +19,26 @@ Flow per city:
   9. YouTube verification → graph scoring → CSV export
 """
 import asyncio
-import json
+import functools
 import re as _re
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 import aiohttp
 
 from config.settings import (BASE_DIR, MODELS, MAX_WAVES, PAGES_PER_QUERY, MAX_PAGES_TO_FETCH,
-    MIN_TRIAGE_SCORE, MIN_CITY_SCORE, MIN_TOTAL_SCORE, RESOLVED, FAILED, PARTIAL, IN_PROGRESS, PENDING)
-from config.cities import US_STATES_CITIES, CATEGORIES, CATEGORY_LABELS
+    FETCH_CONCURRENCY, STATE_CONCURRENCY, VERIFY_CONCURRENCY, LLM_CONCURRENCY, JITTER_PAGE, JITTER_ENGINE, JITTER_QUERY, JITTER_FOLLOWUP,
+    SEARCH_ENGINE_EARLY_STOP, SAVE_INTERVAL_S, MIN_TRIAGE_SCORE, MIN_CITY_SCORE, MIN_TOTAL_SCORE, RESOLVED, FAILED, PARTIAL, IN_PROGRESS, PENDING)
+from config.cities import US_STATES_CITIES, CATEGORIES, CATEGORY_LABELS, TASK_PLAN
 from models.data_models import (Fragment, ChannelCandidate, CategoryResolution,
     CityResolution, StateResolution)
 from server.server_core.state import app_state
 from server.server_core.llm_client import query_llm
 from utils.logger import logger
+from utils import fast_json
 from pipeline.pipeline_ui.progress import progress_callback
 from pipeline.pipeline_core.query_generator import generate_queries
 from pipeline.pipeline_core.result_triage import triage_results
@@ -44,7 +47,7 @@ from pipeline.pipeline_core.candidate_assembler import assemble_candidates
 from pipeline.pipeline_core.followup_search import run_followups
 from pipeline.pipeline_core.verification import verify_city, verify_category
 from pipeline.pipeline_core.escalation import analyze_failure
-from pipeline.pipeline_core.csv_saver import save_search_csv, save_verified_csv
+from pipeline.pipeline_core.csv_saver import CsvSaverSession
 from web_search.web_search_core.html_parser import parse_search_html, save_parsed_csv
 from web_search.web_search import fetch_page, verify_youtube_channel
 
@@ -75,10 +78,15 @@ async def checkpoint(name: str, data: dict) -> str:
     app_state.checkpoint_modifications = {}
     app_state.checkpoint_event = asyncio.Event()
 
-    while not app_state.checkpoint_event.is_set():
+    # Wake as soon as the UI sets the event; the timeout only re-checks scan_running
+    ev = app_state.checkpoint_event
+    while not ev.is_set():
         if not app_state.scan_running:
             return "skip"
-        await asyncio.sleep(0.3)
+        try:
+            await asyncio.wait_for(ev.wait(), timeout=1.0)
+        except asyncio.TimeoutError:
+            pass
 
     response = app_state.checkpoint_response or "continue"
     app_state.checkpoint_waiting = False
@@ -87,58 +95,146 @@ async def checkpoint(name: str, data: dict) -> str:
     return response
 
 
+CHECKPOINT_MAX_AGE_S = 24 * 3600  # older pending checkpoints are ignored on startup
+
+
 def _save_checkpoint(name, data):
-    p = BASE_DIR / "RESULTATS" / "_checkpoint.json"
-    p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps({"name": name, "data": data, "time": time.time()},
-                            ensure_ascii=False, default=str), encoding="utf-8")
+    # tmp + rename: a crash mid-write never leaves a truncated checkpoint behind
+    fast_json.write_atomic(BASE_DIR / "RESULTATS" / "_checkpoint.json",
+                           {"name": name, "data": data, "time": time.time(), "time_ns": time.time_ns()})
 
 def _clear_checkpoint():
     p = BASE_DIR / "RESULTATS" / "_checkpoint.json"
     if p.exists():
         p.unlink()
 
+def _load_checkpoint_on_startup() -> Optional[dict]:
+    """Last pending checkpoint from a crashed run, or None if absent/corrupt/stale."""
+    p = BASE_DIR / "RESULTATS" / "_checkpoint.json"
+    try:
+        cp = fast_json.loads(p.read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.log(f"[RESUME] Unreadable checkpoint ignored: {str(e)[:80]}")
+        return None
+    age_ns = time.time_ns() - cp.get("time_ns", int(cp.get("time", 0) * 1e9))
+    if age_ns > CHECKPOINT_MAX_AGE_S * 1_000_000_000:
+        logger.log(f"[RESUME] Stale checkpoint '{cp.get('name', '?')}' ignored ({age_ns // 3_600_000_000_000}h old)")
+        return None
+    return cp
+
 
 # ══════════════════════════════════════
 # HELPERS
 # ══════════════════════════════════════
 
+_SAFE_RE = _re.compile(r'[^a-zA-Z0-9_-]')
+
+
+@functools.lru_cache(maxsize=4096)
 def _safe(text: str, maxlen: int = 40) -> str:
     """Safe folder/file name."""
-    return _re.sub(r'[^a-zA-Z0-9_-]', '', text.replace(' ', '_'))[:maxlen]
+    return _SAFE_RE.sub('', text.replace(' ', '_'))[:maxlen]
+
+
+@functools.lru_cache(maxsize=4)
+def _read_plan(path: str, mtime_ns: int) -> tuple:
+    """Parse strategy_plan.json once per (path, mtime) into per-tier query tuples.
+    Each tier is a tuple of (template, angle, step_id, source_type); {country} is pre-filled."""
+    plan = fast_json.loads(Path(path).read_bytes())
+    tiers = []
+    for strat in plan.get("strategies", []):
+        rows = []
+        for step in strat.get("steps", []):
+            # Step queries first, then its sub_steps
+            for node in (step, *step.get("sub_steps", [])):
+                meta = (node.get("action", ""), node.get("id", ""), node.get("source_type", ""))
+                for q in node.get("queries", []):
+                    rows.append((q.replace("{country}", "USA"),) + meta)
+        tiers.append(tuple(rows))
+    return tuple(tiers)
+
+
+# Background writes (CSV, caches, cost state) get their own thread instead of the default
+# pool, so they never wait behind HTML parsing when several states run at once.
+# One worker: the writer is sequential anyway and writes to one path must stay ordered.
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="io")
+
+# LLM result caches persisted across runs (keys joined with \x1f)
+_TRIAGE_CACHE_PATH = BASE_DIR / "RESULTATS" / "_triage_cache.json"   # city, state, cat_label, url
+_VERIFY_CACHE_PATH = BASE_DIR / "RESULTATS" / "_verify_cache.json"   # "city"|"cat", channel_url, ...
+VERIFY_CACHE_TTL_S = 7 * 24 * 3600
+TRIAGE_CACHE_TTL_S = 7 * 24 * 3600
+TRIAGE_CACHE_MAX = 50000          # entries kept on save (newest first)
+
+
+def _load_cache(path: Path) -> Dict[str, Dict]:
+    try:
+        return fast_json.loads(path.read_bytes())
+    except Exception:
+        return {}
+
+
+def _save_cache(path: Path, cache: Dict[str, Dict]):
+    fast_json.write_atomic(path, cache)
+
+
+def _jsleep(span):
+    """Jittered sleep: uniform in span=(lo, hi) seconds."""
+    lo, hi = span
+    return asyncio.sleep(lo + (hi - lo) * random.random())
+
+
+def _normalize_queries(queries) -> List[Dict]:
+    """Coerce raw queries (str or dict) to dicts that always carry query/angle/source_type."""
+    out = []
+    for qd in queries:
+        if isinstance(qd, dict):
+            qd.setdefault("query", "")
+            qd.setdefault("angle", "?")
+            qd.setdefault("source_type", "direct")
+        else:
+            qd = {"query": str(qd), "angle": "?", "source_type": "direct"}
+        out.append(qd)
+    return out
+
+
+# GraphScorer criterion name -> predicate(ch, cand, yt, city_score, cat_score); first match wins
+_CRITERION_RULES = (
+    (_re.compile(r"diplome"), lambda ch, cand, yt, cs, cas: bool(cand.get("education_evidence"))),
+    (_re.compile(r"localisation|location"), lambda ch, cand, yt, cs, cas: cs >= 0.5),
+    (_re.compile(r"mots_cles|keyword"), lambda ch, cand, yt, cs, cas: cas >= 0.5),
+    (_re.compile(r"site|external"), lambda ch, cand, yt, cs, cas: bool(yt.get("external_links"))),
+    (_re.compile(r"activite|recent"), lambda ch, cand, yt, cs, cas: ch.yt_last_upload_recent),
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _criterion_rule(name: str):
+    """Predicate for a criterion name, or None (criterion never met automatically)."""
+    return next((fn for pat, fn in _CRITERION_RULES if pat.search(name)), None)
 
 
 def _load_plan_queries(city: str, state: str, cat_label: str, wave: int) -> Optional[List[Dict]]:
     """Try to load queries from saved StrategyPlanner plan."""
     plan_path = BASE_DIR / "RESULTATS" / "strategy_plan.json"
-    if not plan_path.exists():
-        return None
     try:
-        plan = json.loads(plan_path.read_text(encoding="utf-8"))
-        strategies = plan.get("strategies", [])
-        if not strategies:
-            return None
-
-        # Pick strategy tier based on wave
-        tier_idx = min(wave - 1, len(strategies) - 1)
-        strat = strategies[tier_idx]
-
-        queries = []
-        for step in strat.get("steps", []):
-            for q in step.get("queries", []):
-                filled = q.replace("{city}", city).replace("{state}", state).replace("{country}", "USA")
-                queries.append({"query": filled, "angle": step.get("action", ""),
-                                "step_id": step.get("id", ""), "source_type": step.get("source_type", "")})
-            # Also recurse into sub_steps
-            for sub in step.get("sub_steps", []):
-                for q in sub.get("queries", []):
-                    filled = q.replace("{city}", city).replace("{state}", state).replace("{country}", "USA")
-                    queries.append({"query": filled, "angle": sub.get("action", ""),
-                                    "step_id": sub.get("id", ""), "source_type": sub.get("source_type", "")})
-        return queries if queries else None
+        tiers = _read_plan(str(plan_path), plan_path.stat().st_mtime_ns)
+    except FileNotFoundError:
+        return None
     except Exception as e:
         logger.log(f"  [PLAN] Error loading: {str(e)[:80]}")
         return None
+    if not tiers:
+        return None
+
+    # Pick strategy tier based on wave
+    rows = tiers[min(wave - 1, len(tiers) - 1)]
+    queries = [{"query": t.replace("{city}", city).replace("{state}", state),
+                "angle": angle, "step_id": sid, "source_type": st}
+               for t, angle, sid, st in rows]
+    return queries if queries else None
 
 
 # ══════════════════════════════════════
@@ -150,6 +246,10 @@ class PipelineOrchestrator:
         self.running = True
         self.states: Dict[str, StateResolution] = {}
         self.graph = GraphScorer()
+        self.triage_cache: Dict[str, Dict] = _load_cache(_TRIAGE_CACHE_PATH)
+        self.verify_cache: Dict[str, Dict] = _load_cache(_VERIFY_CACHE_PATH)
+        self._verify_dirty = False
+        self._triage_dirty = False
         self.cost = CostEngine(
             target_count=int(app_state.progress.get("total_tasks", 450)),
             patience_initial=30,
@@ -160,10 +260,123 @@ class PipelineOrchestrator:
         self.cost.add_source("direct", priority=90)
         self.cost.add_source("semi_direct", priority=60)
         self.cost.add_source("indirect", priority=40)
+        # One pooled HTTP session for every phase (created lazily inside the event loop)
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._fetch_sem = asyncio.Semaphore(FETCH_CONCURRENCY)
+        self._verify_sem = asyncio.Semaphore(VERIFY_CONCURRENCY)
+        self._llm_sem = asyncio.Semaphore(LLM_CONCURRENCY)
+        self._dirs_created: set = set()
+        # Per-city CSV sessions: files are collected during the city and written once at its end
+        self._csv: Dict[Tuple[str, str], CsvSaverSession] = {}
+        # Background writer: CSV dumps are queued and written off the event loop
+        self._io_queue: asyncio.Queue = asyncio.Queue()
+        self._io_task: Optional[asyncio.Task] = None
 
     def stop(self):
         self.running = False
 
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(
+                limit=200, limit_per_host=8, ttl_dns_cache=300, keepalive_timeout=30))
+        return self.session
+
+    async def _triage(self, unique, city, state_name, cat_label, log) -> List[Dict]:
+        """Phase 3 with a (city, state, category, url) score cache shared across waves."""
+        prefix = f"{city}\x1f{state_name}\x1f{cat_label}\x1f"
+        scored, to_score = [], []
+        now = time.time()
+        for r in unique:
+            hit = self.triage_cache.get(prefix + r.get("url", ""))
+            if hit is None or now - hit.get("t", 0) >= TRIAGE_CACHE_TTL_S:
+                to_score.append(r)
+            else:
+                sc = {"url": r.get("url", ""), "score": hit["score"], "reason": hit["reason"]}
+                sc.update(r)
+                scored.append(sc)
+        log(f"      [P3] Scoring {len(to_score)} results ({len(scored)} cached)...")
+        if to_score:
+            # min_score=0: keep every LLM-scored row so low scores get cached too.
+            # URLs missing from the reply (failed batch) are not cached and retried next wave.
+            fresh = await triage_results(to_score, city, state_name, cat_label, 0, query_llm)
+            now = time.time()
+            for sc in fresh:
+                self.triage_cache[prefix + sc.get("url", "")] = {"score": sc.get("score", 0),
+                                                                 "reason": sc.get("reason", ""), "t": now}
+            scored.extend(fresh)
+            if fresh:
+                self._triage_dirty = True   # written by save_triage_cache on the throttled save path
+        scored.sort(key=lambda x: x.get("score", 0), reverse=True)
+        return [sc for sc in scored if sc.get("score", 0) >= MIN_TRIAGE_SCORE]
+
+    def _ensure_dir(self, path: Path):
+        """mkdir -p, hitting the filesystem only the first time a path is seen."""
+        key = str(path)
+        if key not in self._dirs_created:
+            path.mkdir(parents=True, exist_ok=True)
+            self._dirs_created.add(key)
+
+    def _queue_io(self, fn, *args) -> asyncio.Future:
+        """Hand a blocking write to the background writer (started on first use).
+        The returned future resolves once this write is done (failures are logged, not raised),
+        so a caller can wait for its own write without joining the whole queue."""
+        if self._io_task is None:
+            self._io_task = asyncio.create_task(self._io_writer())
+        done = asyncio.get_running_loop().create_future()
+        self._io_queue.put_nowait((fn, args, done))
+        return done
+
+    async def _io_writer(self):
+        while True:
+            fn, args, done = await self._io_queue.get()
+            try:
+                await asyncio.get_running_loop().run_in_executor(_IO_EXECUTOR, fn, *args)
+            except Exception as e:
+                logger.log(f"  [IO] {fn.__name__} failed: {str(e)[:80]}")
+            finally:
+                self._io_queue.task_done()
+                if not done.done():
+                    done.set_result(None)
+
+    def save_cost(self):
+        """Hand a CostEngine snapshot to the background writer; no-op if nothing changed."""
+        snap = self.cost.snapshot()
+        if snap is not None:
+            self._queue_io(fast_json.write_atomic, self.cost.state_path(), snap, True)
+
+    def save_triage_cache(self):
+        """Drop expired entries, cap at TRIAGE_CACHE_MAX (newest kept) and hand a copy to the
+        background writer; no-op if nothing was scored since the last save."""
+        if not self._triage_dirty:
+            return
+        self._triage_dirty = False
+        now = time.time()
+        cache = {k: v for k, v in self.triage_cache.items() if now - v.get("t", 0) < TRIAGE_CACHE_TTL_S}
+        if len(cache) > TRIAGE_CACHE_MAX:
+            cache = dict(sorted(cache.items(), key=lambda kv: kv[1]["t"])[-TRIAGE_CACHE_MAX:])
+        self.triage_cache = cache
+        self._queue_io(_save_cache, _TRIAGE_CACHE_PATH, dict(cache))
+
+    def checkpoint_graph(self):
+        """Fold the GraphScorer WAL back into the DB from the IO thread, not the event loop."""
+        self._queue_io(self.graph.checkpoint)
+
+    async def flush_io(self):
+        """Wait until every queued write is on disk."""
+        if self._io_task is not None:
+            await self._io_queue.join()
+
+    async def aclose(self):
+        """Flush pending writes and close the shared HTTP session (end of scan)."""
+        self.save_triage_cache()
+        await self.flush_io()
+        if self._io_task is not None:
+            self._io_task.cancel()
+            self._io_task = None
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
     # ── State loop ──
 
     async def process_state(self, state_name: str, cities: List[str]) -> StateResolution:
@@ -172,8 +385,8 @@ class PipelineOrchestrator:
         for c in cities:
             cr = CityResolution(city=c, state=state_name, status=PENDING)
             for cat in CATEGORIES:
-                cr.categories[cat] = CategoryResolution(category=cat)
-            sr.cities[c] = cr
+                cr.add_category(CategoryResolution(category=cat))
+            sr.add_city(cr)
         for city_name in cities:
             if not self.running:
                 break
@@ -190,11 +403,21 @@ class PipelineOrchestrator:
         city = city_res.city
         logger.log(f"\n  {'─'*50}\n  CITY: {city}, {state_name}\n  {'─'*50}")
         city_res.status = IN_PROGRESS
+        self._csv[state_name, city] = CsvSaverSession(state_name, city)
+        try:
+            await self._process_city_waves(city_res, state_name)
+        finally:
+            written = self._queue_io(self._csv.pop((state_name, city)).flush)
+        # Only this city's CSVs: other states' queued writes don't hold this one up
+        await written
 
+    async def _process_city_waves(self, city_res: CityResolution, state_name: str):
+        city = city_res.city
         for wave in range(1, MAX_WAVES + 1):
             if not self.running:
                 break
-            unresolved = [k for k, v in city_res.categories.items() if v.status not in (RESOLVED, FAILED)]
+            unresolved = [k for k, v in city_res.categories.items()
+                          if v.status is not RESOLVED and v.status is not FAILED]
             if not unresolved:
                 break
             logger.log(f"\n  [WAVE {wave}/{MAX_WAVES}] Unresolved: {', '.join(unresolved)}")
@@ -208,8 +431,8 @@ class PipelineOrchestrator:
                 break
 
         for v in city_res.categories.values():
-            if v.status not in (RESOLVED, FAILED):
-                v.status = FAILED
+            if v.status is not RESOLVED and v.status is not FAILED:
+                v.set_status(FAILED)
                 v.failure_reason = f"Exhausted {MAX_WAVES} waves"
         city_res.status = RESOLVED if city_res.is_resolved() else PARTIAL
         logger.log(f"  [CITY DONE] {city}: {city_res.summary()}")
@@ -217,7 +440,7 @@ class PipelineOrchestrator:
     # ── Category wave — the main work ──
 
     async def _process_category_wave(self, city, state_name, cat_key, cat_label, cat_res, city_res, wave):
-        cat_res.status = IN_PROGRESS
+        cat_res.set_status(IN_PROGRESS)
         cat_res.waves_attempted = wave
         log = logger.log
 
@@ -225,79 +448,85 @@ class PipelineOrchestrator:
         queries = await self._generate_queries(city, state_name, cat_key, cat_label, wave, cat_res)
         if not queries:
             log(f"      [P1] No queries generated")
-            cat_res.status = FAILED
+            cat_res.set_status(FAILED)
             cat_res.failure_reason = "No queries"
             return
+        queries = _normalize_queries(queries)
 
         # ─── CHECKPOINT 1: Validate queries ───
         cp1 = await checkpoint("queries_ready", {
             "state": state_name, "city": city, "category": cat_label, "wave": wave,
-            "queries": [{"num": i + 1,
-                         "query": qd.get("query", "") if isinstance(qd, dict) else str(qd),
-                         "angle": qd.get("angle", "?") if isinstance(qd, dict) else "?"}
+            "queries": [{"num": i + 1, "query": qd["query"], "angle": qd["angle"]}
                         for i, qd in enumerate(queries)],
             "message": f"{len(queries)} requetes pour {city} / {cat_label} (vague {wave}). Valider?",
         })
         if cp1 == "skip":
-            cat_res.status = FAILED
+            cat_res.set_status(FAILED)
             cat_res.failure_reason = "Skipped by user"
             return
         if cp1 == "modify" and app_state.checkpoint_modifications.get("queries"):
             new_qs = app_state.checkpoint_modifications["queries"]
-            queries = [{"query": q["query"], "angle": q.get("angle", "custom")}
-                       for q in new_qs if q.get("query", "").strip()]
+            queries = _normalize_queries({"query": q["query"], "angle": q.get("angle", "custom")}
+                                         for q in new_qs if q.get("query", "").strip())
             log(f"      [P1] User modified → {len(queries)} queries")
 
         # ─── PHASE 2: Browser search ───
         all_results, query_entries = await self._search(
             queries, city, state_name, cat_key, cat_label, wave, cat_res)
 
-        # Dedup
-        seen = set()
-        unique = [r for r in all_results
-                  if r.get("url") not in seen and not seen.add(r.get("url", ""))]
+        # Dedup by URL (first occurrence wins, order kept). rows_by_url keeps every
+        # row per URL: they are the query_entries rows that receive triage scores.
+        rows_by_url = {}
+        for r in all_results:
+            rows = rows_by_url.get(r.get("url", ""))
+            if rows is None:
+                rows_by_url[r.get("url", "")] = [r]
+            else:
+                rows.append(r)
+        unique = [rows[0] for rows in rows_by_url.values()]
         log(f"      [P2] {len(all_results)} total → {len(unique)} unique")
 
         if not unique:
-            save_search_csv(state_name, city, cat_key, query_entries)
+            self._csv[state_name, city].add_search(cat_key, query_entries)
             self.cost.report_result("direct", found=0, cost=len(queries))
             await self._escalate(city, state_name, cat_key, cat_label, cat_res, wave, queries, 0, 0, 0, 0)
             return
 
+        # One pass: count YouTube results for the cost report and checkpoint 2
+        yt_in_results = 0
+        for r in unique:
+            yt_in_results += "youtube.com" in r.get("url", "") or "youtube.com" in r.get("domain", "")
+
         # CostEngine: report search results
-        yt_in_results = sum(1 for r in unique if "youtube.com" in r.get("url", ""))
         source_tier = "direct" if wave == 1 else ("semi_direct" if wave == 2 else "indirect")
         self.cost.report_result(source_tier, found=yt_in_results, cost=len(queries),
                                 query=f"{city}/{cat_label}/wave{wave}")
 
         # ─── CHECKPOINT 2: Review search results ───
-        yt_found = [r for r in unique if "youtube.com" in r.get("url", "") or "youtube.com" in r.get("domain", "")]
         cp2 = await checkpoint("search_done", {
             "state": state_name, "city": city, "category": cat_label, "wave": wave,
-            "total_links": len(unique), "youtube_links": len(yt_found),
+            "total_links": len(unique), "youtube_links": yt_in_results,
             "top_results": [{"url": r.get("url", ""), "title": r.get("title", "")[:80]}
                             for r in unique[:30]],
-            "message": f"{len(unique)} liens ({len(yt_found)} YouTube). Analyser?",
+            "message": f"{len(unique)} liens ({yt_in_results} YouTube). Analyser?",
         })
         if cp2 == "skip":
-            save_search_csv(state_name, city, cat_key, query_entries)
-            cat_res.status = FAILED
+            self._csv[state_name, city].add_search(cat_key, query_entries)
+            cat_res.set_status(FAILED)
             cat_res.failure_reason = "Skipped after search"
             return
 
         # ─── PHASE 3: Triage ───
-        log(f"      [P3] Scoring {len(unique)} results...")
-        scored = await triage_results(unique, city, state_name, cat_label, MIN_TRIAGE_SCORE, query_llm)
+        scored = await self._triage(unique, city, state_name, cat_label, log)
         to_fetch = scored[:MAX_PAGES_TO_FETCH]
         log(f"      [P3] {len(to_fetch)} pages to fetch")
 
-        # Merge triage scores into query_entries
-        score_map = {s.get("url", ""): {"score": s.get("score", ""), "reason": s.get("reason", "")} for s in scored}
-        for qe in query_entries:
-            for r in qe.get("results", []):
-                if r["url"] in score_map:
-                    r.update(score_map[r["url"]])
-        save_search_csv(state_name, city, cat_key, query_entries)
+        # Merge triage scores into query_entries (rows are shared with all_results)
+        for sc in scored:
+            for r in rows_by_url.get(sc.get("url", ""), ()):
+                r["score"] = sc.get("score", "")
+                r["reason"] = sc.get("reason", "")
+        self._csv[state_name, city].add_search(cat_key, query_entries)
 
         if not to_fetch:
             await self._escalate(city, state_name, cat_key, cat_label, cat_res, wave, queries, len(unique), 0, 0, 0)
@@ -307,22 +536,29 @@ class PipelineOrchestrator:
         log(f"      [P4] Fetching pages...")
         all_frags = []
         cross = []
-        async with aiohttp.ClientSession() as session:
-            for j, pi in enumerate(to_fetch):
+        session = await self._ensure_session()
+
+        async def fetch_and_extract(j, pi):
+            purl = pi.get("url", "")
+            if not purl:
+                return None
+            async with self._fetch_sem:
                 if not self.running:
-                    break
-                purl = pi.get("url", "")
-                if not purl:
-                    continue
+                    return None
                 log(f"        Page {j + 1}/{len(to_fetch)}: {purl[:70]}")
                 pd = await fetch_page(purl, session)
                 if not pd["success"]:
-                    log(f"          [SKIP] {pd.get('error', '')}")
-                    continue
+                    log(f"          [SKIP p{j + 1}] {pd.get('error', '')}")
+                    return None
                 frags, cr = await extract_fragments(pd, pi, city, state_name, cat_label, wave, query_llm)
-                log(f"          {len(frags)} creators extracted")
-                all_frags.extend(frags)
-                cross.extend(cr)
+                log(f"          p{j + 1}: {len(frags)} creators extracted")
+                return frags, cr
+
+        # gather keeps to_fetch order for the merged fragments
+        for res in await asyncio.gather(*(fetch_and_extract(j, pi) for j, pi in enumerate(to_fetch))):
+            if res:
+                all_frags.extend(res[0])
+                cross.extend(res[1])
         city_res.cross_city_fragments.extend(cross)
         log(f"      [P4] {len(all_frags)} fragments, {len(cross)} cross-city refs")
 
@@ -370,7 +606,7 @@ class PipelineOrchestrator:
             "message": f"{len(candidates)} candidats. Verifier YouTube?",
         })
         if cp3 == "skip":
-            cat_res.status = FAILED
+            cat_res.set_status(FAILED)
             cat_res.failure_reason = "Skipped before verification"
             return
 
@@ -383,20 +619,20 @@ class PipelineOrchestrator:
 
         if verified:
             best = max(verified, key=lambda c: c.total_score)
-            cat_res.status = RESOLVED
+            cat_res.set_status(RESOLVED)
             cat_res.best_candidate = best.to_dict()
             cat_res.candidates = [c.to_dict() for c in verified]
             log(f"      ✅ [RESOLVED] {cat_label}: {best.channel_name} (score: {best.total_score})")
             progress_callback({"type": "category_resolved", "state": state_name,
                                "city": city, "category": cat_key, "channel": best.to_dict()})
-            save_verified_csv(state_name, city, cat_key, [c.to_dict() for c in verified])
+            self._csv[state_name, city].add_verified(cat_key, [c.to_dict() for c in verified])
 
             # Feed verified into graph scorer with scoring
             self.cost.report_result(source_tier, found=len(verified), cost=0, value=len(verified) * 20)
         else:
             log(f"      ❌ [NOT RESOLVED] {cat_label} — wave {wave}")
             if wave >= MAX_WAVES:
-                cat_res.status = FAILED
+                cat_res.set_status(FAILED)
                 cat_res.failure_reason = f"No verified channel after {wave} waves"
 
     # ══════════════════════════════════════
@@ -438,18 +674,21 @@ class PipelineOrchestrator:
             browser = None
 
         if browser:
+            # Constant for the whole category wave: build once
+            step_folder = f"Etape_{wave}_{_safe(cat_label)}"
+            step_dir = BASE_DIR / "RESULTATS" / _safe(state_name) / _safe(city) / step_folder
             try:
                 for i, qd in enumerate(queries):
                     if not self.running:
                         break
-                    q = qd.get("query", "") if isinstance(qd, dict) else str(qd)
+                    q = qd["query"]
                     if not q:
                         continue
-                    angle = qd.get("angle", "?") if isinstance(qd, dict) else "?"
+                    angle = qd["angle"]
                     query_num = i + 1
 
                     # CostEngine check: is this query worth doing?
-                    src = qd.get("source_type", "direct")
+                    src = qd["source_type"]
                     if src not in self.cost.sources:
                         self.cost.add_source(src, priority=50)
                     ev = self.cost.evaluate_action(src)
@@ -458,7 +697,10 @@ class PipelineOrchestrator:
                         continue
 
                     log(f"        R{query_num}/{len(queries)}: {q[:70]}")
+                    query_folder = f"Requete_{query_num}_{_safe(q[:40])}"
+                    results_dir = step_dir / query_folder
 
+                    yt_hits = 0
                     for engine in ["brave", "google"]:
                         if not self.running:
                             break
@@ -477,14 +719,7 @@ class PipelineOrchestrator:
                                 log(f"            [SKIP] Navigation failed p{page_num + 1}")
                                 break
 
-                            # Build folder path
-                            step_folder = f"Etape_{wave}_{_safe(cat_label)}"
-                            safe_q = _safe(q[:40])
-                            query_folder = f"Requete_{query_num}_{safe_q}"
-                            results_dir = (BASE_DIR / "RESULTATS" /
-                                           _safe(state_name) / _safe(city) /
-                                           step_folder / query_folder)
-                            results_dir.mkdir(parents=True, exist_ok=True)
+                            self._ensure_dir(results_dir)
 
                             filename = f"{engine}_p{page_num + 1}.html"
                             html_path = results_dir / filename
@@ -492,8 +727,10 @@ class PipelineOrchestrator:
 
                             if save_result["success"]:
                                 log(f"            Saved: {step_folder}/{query_folder}/{filename}")
-                                parsed = parse_search_html(str(html_path))
-                                save_parsed_csv(str(html_path), parsed)
+                                rel_html = str(html_path.relative_to(BASE_DIR))
+                                # HTML parsing is blocking: keep it off the event loop
+                                parsed = await asyncio.to_thread(parse_search_html, html=save_result["html"])
+                                self._queue_io(save_parsed_csv, str(html_path), parsed)
 
                                 qe_results = []
                                 for link in parsed.get("links", []):
@@ -501,7 +738,7 @@ class PipelineOrchestrator:
                                          "snippet": link.get("snippet", ""), "domain": link.get("domain", ""),
                                          "source_query": q, "angle": angle, "engine": engine,
                                          "page_num": page_num + 1,
-                                         "html_file": str(html_path.relative_to(BASE_DIR))}
+                                         "html_file": rel_html}
                                     all_results.append(r)
                                     qe_results.append(r)
 
@@ -510,35 +747,33 @@ class PipelineOrchestrator:
                                          "snippet": "", "domain": "youtube.com",
                                          "source_query": q, "angle": angle, "engine": engine,
                                          "page_num": page_num + 1,
-                                         "html_file": str(html_path.relative_to(BASE_DIR))}
+                                         "html_file": rel_html}
                                     all_results.append(r)
                                     qe_results.append(r)
 
-                                log(f"            Parsed: {parsed['link_count']} links, {len(parsed.get('youtube_urls', []))} YT")
+                                n_yt = len(parsed.get("youtube_urls", []))
+                                yt_hits += n_yt
+                                log(f"            Parsed: {parsed['link_count']} links, {n_yt} YT")
 
                                 query_entries.append({
                                     "query": q, "angle": angle, "wave": wave,
                                     "query_num": query_num, "engine": engine,
-                                    "html_file": str(html_path.relative_to(BASE_DIR)),
-                                    "results": [{"url": r["url"], "title": r["title"],
-                                                 "snippet": r.get("snippet", ""), "domain": r.get("domain", ""),
-                                                 "page_num": page_num + 1, "score": "", "reason": ""}
-                                                for r in qe_results]
+                                    "html_file": rel_html,
+                                    # Same dicts as all_results: triage scores land here directly
+                                    "results": qe_results,
                                 })
 
-                                # Push to UI log (capped)
+                                # Push to UI log (deque, capped at 200)
                                 app_state.query_log.append({
                                     "state": state_name, "city": city, "category": cat_key,
                                     "cat_label": cat_label, "wave": wave, "query": q, "angle": angle,
                                     "query_num": query_num, "engine": engine,
-                                    "html_file": str(html_path.relative_to(BASE_DIR)),
+                                    "html_file": rel_html,
                                     "results_count": len(qe_results),
                                     "results": [{"url": r["url"], "title": r["title"][:100],
                                                  "snippet": r.get("snippet", "")[:150]}
                                                 for r in qe_results[:20]]
                                 })
-                                if len(app_state.query_log) > 200:
-                                    app_state.query_log = app_state.query_log[-150:]
 
                                 if parsed["link_count"] < 3:
                                     break
@@ -546,36 +781,45 @@ class PipelineOrchestrator:
                                 log(f"            [FAIL] {save_result.get('error', '')[:60]}")
                                 break
 
-                            await asyncio.sleep(random.uniform(3, 7))
-                        await asyncio.sleep(random.uniform(4, 9))
+                            # No page pause after the last page: the engine pause covers it
+                            if page_num + 1 < PAGES_PER_QUERY:
+                                await _jsleep(JITTER_PAGE)
 
-                    cat_res.search_log.append(qd if isinstance(qd, dict) else {"query": q})
-                    await asyncio.sleep(random.uniform(5, 12))
+                        # Google mostly repeats what Brave found: skip it when Brave already
+                        # gave enough YouTube hits, or when the CostEngine says stop
+                        if engine == "brave":
+                            if yt_hits >= SEARCH_ENGINE_EARLY_STOP:
+                                log(f"          [GOOGLE] skipped: {yt_hits} YouTube hits on Brave")
+                                break
+                            ev = self.cost.evaluate_action(src)
+                            if not ev["execute"]:
+                                log(f"          [GOOGLE] skipped: {ev['reason']}")
+                                break
+                        await _jsleep(JITTER_ENGINE)
+
+                    cat_res.search_log.append(qd)
+                    await _jsleep(JITTER_QUERY)
             finally:
                 await browser.close()
                 log(f"      [P2] Browser closed")
         else:
             # HTTP fallback
-            async with aiohttp.ClientSession() as session:
-                from web_search.web_search import brave_search_paginated
-                for i, qd in enumerate(queries):
-                    q = qd.get("query", "") if isinstance(qd, dict) else str(qd)
-                    if not q:
-                        continue
-                    angle = qd.get("angle", "?") if isinstance(qd, dict) else "?"
-                    log(f"        Q{i + 1}/{len(queries)} [HTTP]: {q[:70]}")
-                    res = await brave_search_paginated(q, session, max_pages=PAGES_PER_QUERY,
-                                                       log_func=lambda m: log(f"        {m}"))
-                    qe = {"query": q, "angle": angle, "wave": wave, "results": []}
-                    for r in res:
-                        r["source_query"] = q
-                        r["angle"] = angle
-                        qe["results"].append({"url": r.get("url", ""), "title": r.get("title", ""),
-                                              "snippet": r.get("snippet", ""), "domain": r.get("domain", ""),
-                                              "score": "", "reason": ""})
-                    query_entries.append(qe)
-                    all_results.extend(res)
-                    cat_res.search_log.append(qd if isinstance(qd, dict) else {"query": q})
+            session = await self._ensure_session()
+            from web_search.web_search import brave_search_paginated
+            for i, qd in enumerate(queries):
+                q = qd["query"]
+                if not q:
+                    continue
+                angle = qd["angle"]
+                log(f"        Q{i + 1}/{len(queries)} [HTTP]: {q[:70]}")
+                res = await brave_search_paginated(q, session, max_pages=PAGES_PER_QUERY,
+                                                   log_func=lambda m: log(f"        {m}"))
+                for r in res:
+                    r["source_query"] = q
+                    r["angle"] = angle
+                query_entries.append({"query": q, "angle": angle, "wave": wave, "results": res})
+                all_results.extend(res)
+                cat_res.search_log.append(qd)
 
         return all_results, query_entries
 
@@ -592,6 +836,19 @@ class PipelineOrchestrator:
             from web_search.web_search_core.browser import StealthBrowser
             browser = StealthBrowser()
             await browser.start()
+            # Two-slot pipeline: page N is parsed in a worker thread while the
+            # browser already navigates to page N+1 (the page itself is single-use).
+            pending = None
+
+            async def apply(job):
+                cand, task = job
+                parsed = await task
+                for yt_url in parsed.get("youtube_urls", []):
+                    if not cand.get("channel_url"):
+                        cand["channel_url"] = yt_url
+                        log(f"          [FOUND] {yt_url}")
+                        break
+
             try:
                 for cand in incomplete[:5]:
                     name = cand.get("channel_name", "")
@@ -600,134 +857,185 @@ class PipelineOrchestrator:
                     q = f'"{name}" youtube channel'
                     log(f"          Follow-up: {q[:60]}")
                     ok = await browser.search_brave(q, 0)
+                    if pending:
+                        await apply(pending)
+                        pending = None
                     if ok:
                         html = await browser.get_page_content()
                         if html and "youtube.com" in html:
-                            parsed = parse_search_html(html)
-                            for yt_url in parsed.get("youtube_urls", []):
-                                if not cand.get("channel_url"):
-                                    cand["channel_url"] = yt_url
-                                    log(f"          [FOUND] {yt_url}")
-                                    break
-                    await asyncio.sleep(random.uniform(3, 6))
+                            pending = (cand, asyncio.create_task(asyncio.to_thread(parse_search_html, html=html)))
+                    await _jsleep(JITTER_FOLLOWUP)
+                if pending:
+                    await apply(pending)
             finally:
+                if pending:
+                    pending[1].cancel()
                 await browser.close()
         except Exception:
             # Fallback to HTTP
-            async with aiohttp.ClientSession() as session:
-                await run_followups(incomplete, candidates, session, query_llm, log)
+            await run_followups(incomplete, candidates, await self._ensure_session(), query_llm, log)
 
     async def _verify_youtube(self, candidates, city, state_name, cat_key, cat_label, log) -> List[ChannelCandidate]:
-        """Phase 6+7: YouTube verification + adversarial + graph scoring."""
-        verified = []
-        async with aiohttp.ClientSession() as session:
-            for cand in candidates:
+        """Phase 6+7: YouTube verification + adversarial + graph scoring.
+        A: YouTube checks run concurrently; B: the city and category LLM checks of every
+        surviving candidate are issued together; C: scoring + graph writes, in candidate order."""
+        to_verify = [(pos, cand) for pos, cand in enumerate(candidates)
+                     if "youtube.com" in (cand.get("channel_url") or "")]
+        if len(to_verify) < len(candidates):
+            log(f"        {len(candidates) - len(to_verify)} candidates without a YouTube URL skipped")
+
+        # ─── A: YouTube existence + subscriber range ───
+        tasks = [asyncio.create_task(self._check_channel(pos, cand)) for pos, cand in to_verify]
+        passed = []
+        try:
+            for fut in asyncio.as_completed(tasks):
                 if not self.running:
                     break
-                yurl = cand.get("channel_url", "")
-                if not yurl or "youtube.com" not in yurl:
-                    continue
-
-                log(f"        Checking: {cand.get('channel_name', '?')} ({yurl[:50]})")
-                yt = await verify_youtube_channel(yurl, session)
-                if not yt.get("exists"):
-                    log(f"          [REJECT] Not found")
-                    continue
-                if not yt.get("subscriber_in_range"):
-                    log(f"          [REJECT] Subs: {yt.get('subscribers_count', 0)}")
-                    continue
-
-                # Adversarial city check
-                adv = await verify_city(cand, yt, city, state_name, query_llm)
-                city_score = adv.get("final_city_score", 0.5) if adv else 0.5
-                log(f"          City score: {city_score}")
-                if city_score < MIN_CITY_SCORE:
-                    log(f"          [REJECT] City too weak")
-                    continue
-
-                # Category check
-                cat_r = await verify_category(cand, yt, cat_label, query_llm)
-                cat_score = cat_r.get("category_score", 0.5) if cat_r else 0.5
-                if cat_r and not cat_r.get("matches_category", True) and cat_score < 0.3:
-                    log(f"          [REJECT] Category mismatch")
-                    continue
-
-                # Build ChannelCandidate
-                ch = ChannelCandidate(
-                    channel_name=yt.get("channel_name", cand.get("channel_name", "")),
-                    channel_url=yurl, target_city=city, target_state=state_name, target_category=cat_key,
-                    city_evidence=[{"quote": q, "source_url": cand.get("city_evidence_sources", [""])[idx]
-                                    if idx < len(cand.get("city_evidence_sources", [])) else ""}
-                                   for idx, q in enumerate(cand.get("city_evidence_quotes", []))],
-                    independent_sources=len(set(cand.get("city_evidence_sources", []))),
-                    city_score=city_score, category_score=cat_score,
-                    yt_verified=True, yt_exists=True, yt_real_name=yt.get("channel_name", ""),
-                    yt_subscribers_text=yt.get("subscribers_text", ""),
-                    yt_subscribers_count=yt.get("subscribers_count", 0),
-                    yt_subscriber_match=yt.get("subscriber_in_range", False),
-                    yt_last_upload_text=yt.get("last_upload_text", ""),
-                    yt_last_upload_recent=yt.get("last_upload_recent", False),
-                    yt_description=yt.get("description", ""),
-                )
-                ch.compute_total_score()
-                ch.verified = ch.total_score >= MIN_TOTAL_SCORE and ch.yt_subscriber_match
-                log(f"          SCORE: {ch.total_score} | Verified: {ch.verified}")
-
-                if ch.verified:
-                    verified.append(ch)
-
-                    # ─── Feed into GraphScorer ───
-                    eid = self.graph.add_entity(
-                        name=ch.channel_name, kind="person", city=city, state=state_name,
-                        source_type="youtube_verified", status="validated")
-                    tid = self.graph.add_target(
-                        url=yurl, entity_id=eid, platform="youtube",
-                        name=ch.yt_real_name, description=ch.yt_description[:500],
-                        followers=ch.yt_subscribers_count,
-                        is_active=ch.yt_last_upload_recent,
-                        location_detected=city_score >= 0.5,
-                        topic_detected=cat_score >= 0.5,
-                        is_creator=True,
-                    )
-                    # Score with configured criteria (if any)
-                    criteria = self.graph.get_criteria()
-                    if criteria:
-                        for cr in criteria:
-                            met = False
-                            name_cr = cr["name"]
-                            if "diplome" in name_cr:
-                                met = bool(cand.get("education_evidence"))
-                            elif "localisation" in name_cr or "location" in name_cr:
-                                met = city_score >= 0.5
-                            elif "mots_cles" in name_cr or "keyword" in name_cr:
-                                met = cat_score >= 0.5
-                            elif "site" in name_cr or "external" in name_cr:
-                                met = bool(yt.get("external_links"))
-                            elif "activite" in name_cr or "recent" in name_cr:
-                                met = ch.yt_last_upload_recent
-                            self.graph.set_criterion(tid, name_cr, met)
-                        self.graph.compute_score(tid)
+                res = await fut
+                if res is not None:
+                    passed.append(res)
+        finally:
+            for t in tasks:
+                t.cancel()
+        if not passed or not self.running:
+            return []
+        # Keep candidate order regardless of completion order
+        passed.sort(key=lambda r: r[0])
+
+        # ─── B: LLM city + category checks, all in flight at once (cached per channel) ───
+        city_rs, cat_rs = await asyncio.gather(
+            asyncio.gather(*(self._cached_llm(f"city\x1f{cand['channel_url']}\x1f{city}\x1f{state_name}",
+                                              lambda c=cand, y=yt: verify_city(c, y, city, state_name, query_llm))
+                             for _, cand, yt in passed)),
+            asyncio.gather(*(self._cached_llm(f"cat\x1f{cand['channel_url']}\x1f{cat_key}",
+                                              lambda c=cand, y=yt: verify_category(c, y, cat_label, query_llm))
+                             for _, cand, yt in passed)))
+        if self._verify_dirty:
+            self._verify_dirty = False
+            self._queue_io(_save_cache, _VERIFY_CACHE_PATH, dict(self.verify_cache))
+
+        # ─── C: score, keep verified, feed the graph ───
+        verified = []
+        to_graph = []
+        dbg = logger.debug
+        for (_, cand, yt), adv, cat_r in zip(passed, city_rs, cat_rs):
+            yurl = cand["channel_url"]
+            dbg("        Scoring: %s", cand.get("channel_name", "?"))
+            city_score = adv.get("final_city_score", 0.5) if adv else 0.5
+            dbg("          City score: %s", city_score)
+            if city_score < MIN_CITY_SCORE:
+                dbg("          [REJECT] City too weak")
+                continue
+
+            cat_score = cat_r.get("category_score", 0.5) if cat_r else 0.5
+            if cat_r and not cat_r.get("matches_category", True) and cat_score < 0.3:
+                dbg("          [REJECT] Category mismatch")
+                continue
+
+            # Build ChannelCandidate
+            srcs = cand.get("city_evidence_sources") or []
+            n_srcs = len(srcs)
+            ch = ChannelCandidate(
+                channel_name=yt.get("channel_name", cand.get("channel_name", "")),
+                channel_url=yurl, target_city=city, target_state=state_name, target_category=cat_key,
+                city_evidence=[{"quote": q, "source_url": srcs[idx] if idx < n_srcs else ""}
+                               for idx, q in enumerate(cand.get("city_evidence_quotes") or [])],
+                independent_sources=len(set(srcs)),
+                city_score=city_score, category_score=cat_score,
+                yt_verified=True, yt_exists=True, yt_real_name=yt.get("channel_name", ""),
+                yt_subscribers_text=yt.get("subscribers_text", ""),
+                yt_subscribers_count=yt.get("subscribers_count", 0),
+                yt_subscriber_match=yt.get("subscriber_in_range", False),
+                yt_last_upload_text=yt.get("last_upload_text", ""),
+                yt_last_upload_recent=yt.get("last_upload_recent", False),
+                yt_description=yt.get("description", ""),
+            )
+            ch.compute_total_score()
+            ch.verified = ch.total_score >= MIN_TOTAL_SCORE and ch.yt_subscriber_match
+            dbg("          SCORE: %s | Verified: %s", ch.total_score, ch.verified)
+            if not ch.verified:
+                continue
+            verified.append(ch)
+
+            to_graph.append((ch, cand, yt, city_score, cat_score))
+
+        # ─── Feed into GraphScorer: one transaction per batch call, not per candidate ───
+        if to_graph:
+            eids = self.graph.add_entities_batch([
+                {"name": ch.channel_name, "kind": "person", "city": city, "state": state_name,
+                 "source_type": "youtube_verified", "status": "validated"}
+                for ch, *_ in to_graph])
+            tids = self.graph.add_targets_batch([
+                {"url": ch.channel_url, "entity_id": eid, "platform": "youtube",
+                 "name": ch.yt_real_name, "description": ch.yt_description[:500],
+                 "followers": ch.yt_subscribers_count,
+                 "is_active": ch.yt_last_upload_recent,
+                 "location_detected": city_score >= 0.5,
+                 "topic_detected": cat_score >= 0.5,
+                 "is_creator": True}
+                for (ch, _, _, city_score, cat_score), eid in zip(to_graph, eids)])
+            # Score with configured criteria (if any); criteria are invariant for the batch
+            criteria = self.graph.get_criteria()
+            if criteria:
+                rules = [(cr["name"], _criterion_rule(cr["name"])) for cr in criteria]
+                rows = []
+                for (ch, cand, yt, city_score, cat_score), tid in zip(to_graph, tids):
+                    for name_cr, fn in rules:
+                        rows.append((tid, name_cr, fn(ch, cand, yt, city_score, cat_score) if fn else False))
+                self.graph.set_criteria_batch(rows)
+                self.graph.compute_scores_batch(tids)
 
         return verified
 
+    async def _cached_llm(self, key, make_coro):
+        """Run an LLM verification under _llm_sem unless a fresh (< TTL) result is cached.
+        Empty results (LLM failure) are not cached."""
+        hit = self.verify_cache.get(key)
+        if hit is not None and time.time() - hit["t"] < VERIFY_CACHE_TTL_S:
+            return hit["r"]
+        async with self._llm_sem:
+            res = await make_coro()
+        if res:
+            self.verify_cache[key] = {"t": time.time(), "r": res}
+            self._verify_dirty = True
+        return res
+
+    async def _check_channel(self, pos, cand):
+        """Phase 6 YouTube check -> (pos, cand, yt) if the channel exists and is in range, else None."""
+        yurl = cand["channel_url"]
+        async with self._verify_sem:
+            if not self.running:
+                return None
+            logger.debug("        Checking: %s (%.50s)", cand.get("channel_name", "?"), yurl)
+            yt = await verify_youtube_channel(yurl, await self._ensure_session())
+        if not yt.get("exists"):
+            logger.debug("          [REJECT] Not found (%.50s)", yurl)
+            return None
+        if not yt.get("subscriber_in_range"):
+            logger.debug("          [REJECT] Subs: %s (%.50s)", yt.get("subscribers_count", 0), yurl)
+            return None
+        return pos, cand, yt
+
     async def _escalate(self, city, state, cat_key, cat_label, cat_res, wave, queries, tr, pf, fr, vr):
         if wave >= MAX_WAVES:
-            cat_res.status = FAILED
+            cat_res.set_status(FAILED)
             cat_res.failure_reason = f"Exhausted {wave} waves (results:{tr},pages:{pf},frags:{fr})"
             return
         await analyze_failure(city, state, cat_label, wave, queries, tr, pf, fr, vr, query_llm, logger.log)
 
+    def get_results_for_state(self, state_name: str) -> Dict:
+        """{city: {cat: best candidate or failure info}} for one processed state."""
+        sr = self.states.get(state_name)
+        if sr is None:
+            return {}
+        return {cn: {ck: (cat.best_candidate if cat.best_candidate
+                          else {"status": cat.status, "failure_reason": cat.failure_reason,
+                                "waves_attempted": cat.waves_attempted})
+                     for ck, cat in cr.categories.items()}
+                for cn, cr in sr.cities.items()}
+
     def get_results(self) -> Dict:
-        out = {}
-        for sn, sr in self.states.items():
-            out[sn] = {}
-            for cn, cr in sr.cities.items():
-                out[sn][cn] = {}
-                for ck, cat in cr.categories.items():
-                    out[sn][cn][ck] = (cat.best_candidate if cat.best_candidate
-                                       else {"status": cat.status, "failure_reason": cat.failure_reason,
-                                             "waves_attempted": cat.waves_attempted})
-        return out
+        return {sn: self.get_results_for_state(sn) for sn in self.states}
 
 
 # ══════════════════════════════════════
@@ -738,10 +1046,13 @@ async def run_full_scan():
     """Top-level scan function called by server."""
     app_state.scan_running = True
     app_state.progress["started_at"] = time.time()
+    app_state.progress["total_states"] = len(US_STATES_CITIES)
+    app_state.progress["total_tasks"] = len(TASK_PLAN)
     for k in ["completed_states", "completed_tasks", "resolved_tasks", "failed_tasks"]:
         app_state.progress[k] = 0
     app_state.results = {}
     app_state.resolution_status = {}
+    app_state.progress["active_states"] = []
 
     pipe = PipelineOrchestrator()
     app_state.pipeline = pipe
@@ -751,50 +1062,78 @@ async def run_full_scan():
     logger.log(f"Mode: {'AUTO' if app_state.auto_mode else 'VALIDATION'}")
     logger.log(f"Modules: StrategyPlanner={'plan found' if (BASE_DIR/'RESULTATS'/'strategy_plan.json').exists() else 'not found'}")
     logger.log(f"         GraphScorer=SQLite, CostEngine=active")
-    logger.log(f"50 states x 3 cities x {len(CATEGORIES)} categories, max {MAX_WAVES} waves")
+    logger.log(f"{len(US_STATES_CITIES)} states x 3 cities x {len(CATEGORIES)} categories "
+               f"= {len(TASK_PLAN)} tasks, max {MAX_WAVES} waves")
     logger.log("=" * 60)
 
     # Try to resume from last save
     resume_state = _load_resume()
+    pending_cp = _load_checkpoint_on_startup()
+    if pending_cp:
+        logger.log(f"[RESUME] Previous run stopped at checkpoint '{pending_cp.get('name', '?')}'")
 
-    task_times = []
-    for idx, (state_name, cities) in enumerate(US_STATES_CITIES.items()):
-        if not app_state.scan_running:
-            logger.log("SCAN CANCELLED")
-            break
+    journal = _load_state_journal() if resume_state else {}
+    todo = []
+    for state_name, cities in US_STATES_CITIES.items():
         # Skip already completed states (resume)
         if resume_state and state_name in resume_state:
             logger.log(f"[RESUME] Skipping {state_name} (already done)")
-            app_state.progress["completed_states"] = idx + 1
-            continue
-
-        # CostEngine global check
-        if pipe.cost.should_stop():
-            logger.log(f"[COST] Global stop: {pipe.cost._stop_reason}")
-            break
-
-        app_state.progress["current_state"] = state_name
-        t0 = time.time()
-        sr = await pipe.process_state(state_name, cities)
-        task_times.append(time.time() - t0)
-
-        app_state.resolution_status[state_name] = sr.to_dict()
-        for cr in sr.cities.values():
-            for cat in cr.categories.values():
-                app_state.progress["completed_tasks"] += 1
-                if cat.status == RESOLVED:
-                    app_state.progress["resolved_tasks"] += 1
-                elif cat.status == FAILED:
-                    app_state.progress["failed_tasks"] += 1
-        app_state.progress["completed_states"] = idx + 1
-        if task_times:
-            remaining = len(US_STATES_CITIES) - (idx + 1)
-            app_state.progress["eta_seconds"] = int(sum(task_times) / len(task_times) * remaining)
-        app_state.results.update(pipe.get_results())
-
-        # Save after every state (persistence for resume)
-        _save()
-        pipe.cost.save()
+            app_state.progress["completed_states"] += 1
+            if state_name in journal:
+                app_state.results[state_name] = journal[state_name].get("results") or {}
+                if journal[state_name].get("resolution"):
+                    app_state.resolution_status[state_name] = journal[state_name]["resolution"]
+        else:
+            todo.append((state_name, cities))
+
+    # States are independent: run several at once in auto mode. With checkpoints on,
+    # stay sequential — the validation UI shows a single pending checkpoint.
+    n_parallel = STATE_CONCURRENCY if app_state.auto_mode else 1
+    sem = asyncio.Semaphore(n_parallel)
+    task_times = []
+    stop_logged = []
+
+    async def run_state(state_name, cities):
+        async with sem:
+            if not app_state.scan_running or pipe.cost.should_stop():
+                if not stop_logged:
+                    stop_logged.append(True)
+                    logger.log("SCAN CANCELLED" if not app_state.scan_running
+                               else f"[COST] Global stop: {pipe.cost._stop_reason}")
+                return
+
+            _set_active_state(state_name, True)
+            t0 = time.time()
+            try:
+                sr = await pipe.process_state(state_name, cities)
+            finally:
+                _set_active_state(state_name, False)
+            task_times.append(time.time() - t0)
+
+            app_state.resolution_status[state_name] = sr.to_dict()
+            counts = sr.status_counts()
+            app_state.progress["completed_tasks"] += sum(counts.values())
+            app_state.progress["resolved_tasks"] += counts.get(RESOLVED, 0)
+            app_state.progress["failed_tasks"] += counts.get(FAILED, 0)
+            app_state.progress["completed_states"] += 1
+            remaining = len(US_STATES_CITIES) - app_state.progress["completed_states"]
+            app_state.progress["eta_seconds"] = int(sum(task_times) / len(task_times) * remaining / n_parallel)
+            app_state.results[state_name] = pipe.get_results_for_state(state_name)
+
+            # Journal every state; full snapshots at most every SAVE_INTERVAL_S
+            _append_state_journal(state_name)
+            if _save(force=False):
+                pipe.save_cost()
+                pipe.save_triage_cache()
+                pipe.checkpoint_graph()
+
+    tasks = [asyncio.create_task(run_state(sn, c)) for sn, c in todo]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for t in tasks:
+            t.cancel()
+        await pipe.aclose()
 
     app_state.scan_running = False
     _save()
@@ -812,34 +1151,76 @@ async def run_full_scan():
     logger.log("=" * 60)
 
 
-def _save():
-    """Save results + resolution status to disk."""
-    p = BASE_DIR / "results.json"
-    p.parent.mkdir(parents=True, exist_ok=True)
-    with open(p, "w", encoding="utf-8") as f:
-        json.dump({
-            "generated_at": datetime.now().isoformat(),
-            "model": app_state.active_model,
-            "results": app_state.results,
-            "resolution": app_state.resolution_status
-        }, f, indent=2, ensure_ascii=False)
+def _set_active_state(state_name: str, active: bool):
+    """Track every state in flight; current_state lists them all for the UI."""
+    states = app_state.progress.setdefault("active_states", [])
+    if active:
+        states.append(state_name)
+    elif state_name in states:
+        states.remove(state_name)
+    app_state.progress["current_state"] = ", ".join(states)
+
+
+_RESULTS_JOURNAL = BASE_DIR / "RESULTATS" / "results.jsonl"
+_last_save_t = 0.0
+
+
+def _append_state_journal(state_name: str):
+    """Append one line per finished state — O(state) bytes, survives a crash between snapshots."""
+    _RESULTS_JOURNAL.parent.mkdir(parents=True, exist_ok=True)
+    with open(_RESULTS_JOURNAL, "ab") as f:
+        f.write(fast_json.dumps({"state": state_name, "time": time.time(),
+                                 "results": app_state.results.get(state_name, {}),
+                                 "resolution": app_state.resolution_status.get(state_name)}) + b"\n")
+
+
+def _load_state_journal() -> Dict[str, Dict]:
+    """Last journal line per state (a torn final line from a crash is ignored)."""
+    out = {}
+    if not _RESULTS_JOURNAL.exists():
+        return out
+    with open(_RESULTS_JOURNAL, "rb") as f:
+        for line in f:
+            try:
+                d = fast_json.loads(line)
+                out[d["state"]] = d
+            except Exception:
+                continue
+    return out
+
+
+def _save(force: bool = True) -> bool:
+    """Save results + resolution status to disk. force=False: skip if the last
+    snapshot is younger than SAVE_INTERVAL_S (the journal covers the gap)."""
+    global _last_save_t
+    now = time.time()
+    if not force and now - _last_save_t < SAVE_INTERVAL_S:
+        return False
+    _last_save_t = now
+    fast_json.write_atomic(BASE_DIR / "results.json", {
+        "generated_at": datetime.now().isoformat(),
+        "model": app_state.active_model,
+        "results": app_state.results,
+        "resolution": app_state.resolution_status
+    }, indent=True)
 
     # Also save resolution for resume
-    rp = BASE_DIR / "RESULTATS" / "_resume.json"
-    rp.parent.mkdir(parents=True, exist_ok=True)
-    with open(rp, "w", encoding="utf-8") as f:
-        json.dump({"completed_states": list(app_state.resolution_status.keys()),
-                    "progress": app_state.progress}, f, ensure_ascii=False)
+    fast_json.write_atomic(BASE_DIR / "RESULTATS" / "_resume.json",
+                           {"completed_states": list(app_state.resolution_status.keys()),
+                            "progress": app_state.progress})
+    return True
 
 
 def _load_resume() -> Optional[set]:
     """Load completed states for resume after crash."""
     rp = BASE_DIR / "RESULTATS" / "_resume.json"
-    if not rp.exists():
+    journal = _load_state_journal()
+    if not rp.exists() and not journal:
         return None
     try:
-        data = json.loads(rp.read_text(encoding="utf-8"))
-        states = set(data.get("completed_states", []))
+        data = fast_json.loads(rp.read_bytes()) if rp.exists() else {}
+        # The journal may be ahead of the throttled snapshot
+        states = set(data.get("completed_states", [])) | set(journal)
         if states:
             logger.log(f"[RESUME] Found {len(states)} completed states from previous run")
         return states
@@ -1,18 +1,27 @@
 """pipeline/pipeline_core/candidate_assembler.py — Phase 5: Assemble candidates from fragments.
 INPUT: list of fragments | OUTPUT: list of candidate dicts
 """
-import json
 from typing import List, Dict, Callable
 from models.data_models import Fragment
 from prompts.assembly_prompt import TEMPLATE
+from utils import fast_json
 
-async def assemble_candidates(fragments: List[Fragment], city: str, state: str,
-    cat_label: str, llm_func: Callable) -> List[Dict]:
-    ftxt = ""
+def _assembly_prompt(fragments: List[Fragment], city: str, state: str, cat_label: str, limit: int = 15000) -> str:
+    # Stop serializing as soon as `limit` chars are reached: cost stays bounded whatever the fragment count
+    parts, total = [], 0
     for i, f in enumerate(fragments):
-        try: data = json.loads(f.value) if isinstance(f.value,str) else f.value
+        try: data = fast_json.loads(f.value) if isinstance(f.value,str) else f.value
         except: data = {"raw":f.value}
-        ftxt += f"\n--- Fragment {i+1} (from: {f.source_url}, type: {f.source_type}) ---\n{json.dumps(data,indent=2)}\nContext: {f.context}\n"
-    result = await llm_func(TEMPLATE.format(city=city, state=state, category_label=cat_label, fragments_text=ftxt[:15000]))
+        chunk = f"\n--- Fragment {i+1} (from: {f.source_url}, type: {f.source_type}) ---\n{fast_json.dumps(data,indent=True).decode()}\nContext: {f.context}\n"
+        if total + len(chunk) >= limit:
+            parts.append(chunk[:limit - total]); break
+        parts.append(chunk); total += len(chunk)
+    return TEMPLATE.format(city=city, state=state, category_label=cat_label, fragments_text="".join(parts))
+
+def _candidates(result) -> List[Dict]:
     if result and "candidates" in result: return result["candidates"]
     return []
+
+async def assemble_candidates(fragments: List[Fragment], city: str, state: str,
+    cat_label: str, llm_func: Callable) -> List[Dict]:
+    return _candidates(await llm_func(_assembly_prompt(fragments, city, state, cat_label)))
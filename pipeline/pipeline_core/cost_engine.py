@@ -33,12 +33,19 @@ Usage:
     print(engine.summary())
 """
 import time
-import json
 import random
 import math
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Deque, List, Dict, Optional, Tuple
 from dataclasses import dataclass, field, asdict
+from config.settings import BASE_DIR
+from utils import fast_json
+
+
+ACTION_LOG_MAX = 10_000  # action_log keeps the most recent actions only
+_DROUGHT_DECAY = [math.exp(-0.05 * d) for d in range(512)]  # exp(-0.05*drought), drought < 512
 
 
 # ══════════════════════════════════════
@@ -59,6 +66,8 @@ class SourceStats:
     exhausted: bool = False         # True if patience reached 0
     last_hit_at: int = 0            # Attempt number of last hit
     created_at: float = 0.0
+    # eff_priority() memo; reset to None whenever the stats above change
+    _eff_pri_cache: Optional[float] = field(default=None, repr=False, compare=False)
     
     @property
     def hit_rate(self) -> float:
@@ -75,12 +84,16 @@ class SourceStats:
         """How many attempts since last hit."""
         return self.attempts - self.last_hit_at
     
-    @property
-    def effective_priority(self) -> float:
-        """Dynamic priority based on performance.
+    def eff_priority(self) -> float:
+        """Dynamic priority based on performance (cached until the next report).
         High hit rate → higher priority.
         Long drought → lower priority.
         """
+        if self._eff_pri_cache is None:
+            self._eff_pri_cache = self._compute_eff_priority()
+        return self._eff_pri_cache
+
+    def _compute_eff_priority(self) -> float:
         if self.exhausted:
             return 0.0
         if self.attempts == 0:
@@ -99,10 +112,11 @@ class SourceStats:
     
     def to_dict(self) -> Dict:
         d = asdict(self)
+        del d["_eff_pri_cache"]
         d["hit_rate"] = round(self.hit_rate, 3)
         d["roi"] = round(self.roi, 3)
         d["drought"] = self.drought
-        d["effective_priority"] = round(self.effective_priority, 1)
+        d["effective_priority"] = round(self.eff_priority(), 1)
         return d
 
 
@@ -117,6 +131,8 @@ class ActionLog:
     roi_predicted: float = 0.0
     decision: str = ""  # "execute", "skip", "explore"
     timestamp: float = 0.0
+    action_n: int = 0    # 1-based action number (survives log eviction)
+    cum_found: int = 0   # total found up to and including this action
 
 
 # ══════════════════════════════════════
@@ -157,10 +173,11 @@ class CostEngine:
         self.sources: Dict[str, SourceStats] = {}
         self.total_found: int = 0
         self.total_actions: int = 0
-        self.action_log: List[ActionLog] = []
+        self.action_log: Deque[ActionLog] = deque(maxlen=ACTION_LOG_MAX)
         self.started_at: float = time.time()
         self._stopped: bool = False
         self._stop_reason: str = ""
+        self._dirty: bool = False  # state changed since last save/snapshot
     
     # ── Source Management ──
     
@@ -173,6 +190,7 @@ class CostEngine:
                 patience=self.patience_initial,
                 created_at=time.time()
             )
+            self._dirty = True
     
     def get_source(self, name: str) -> Optional[SourceStats]:
         return self.sources.get(name)
@@ -204,7 +222,8 @@ class CostEngine:
             p_success = (1 - alpha) * prior + alpha * src.hit_rate
         
         # Diminishing returns: success probability decays with drought
-        drought_decay = math.exp(-0.05 * src.drought)
+        d = src.drought
+        drought_decay = _DROUGHT_DECAY[d] if 0 <= d < 512 else math.exp(-0.05 * d)
         p_adjusted = p_success * drought_decay
         
         # ROI = probability / cost
@@ -230,17 +249,24 @@ class CostEngine:
             return True
         
         # All sources exhausted
-        active = [s for s in self.sources.values() if not s.exhausted]
-        if not active and self.sources:
+        if self.sources and self._count_exhausted() == len(self.sources):
             self._stop("all_sources_exhausted",
                         f"All {len(self.sources)} sources exhausted")
             return True
         
         return False
     
+    def _count_exhausted(self) -> int:
+        n = 0
+        for s in self.sources.values():
+            if s.exhausted:
+                n += 1
+        return n
+
     def _stop(self, reason: str, detail: str = ""):
         self._stopped = True
         self._stop_reason = f"{reason}: {detail}"
+        self._dirty = True
     
     def force_stop(self):
         self._stop("manual", "Stopped by user")
@@ -252,31 +278,33 @@ class CostEngine:
         
         Returns source name, or None if all exhausted.
         """
-        active = [s for s in self.sources.values() if not s.exhausted]
-        if not active:
-            return None
-        
-        # Epsilon-greedy: explore vs exploit
-        if random.random() < self.epsilon and len(active) > 1:
-            # EXPLORE: pick a random source (not the best one)
-            best = max(active, key=lambda s: s.effective_priority)
-            others = [s for s in active if s.name != best.name]
-            if others:
-                chosen = random.choice(others)
-                return chosen.name
-        
-        # EXPLOIT: pick the source with highest effective priority
-        best = max(active, key=lambda s: s.effective_priority)
-        
-        # Check minimum ROI before committing
-        roi = self.predict_roi(best.name)
-        if roi < self.min_roi and best.attempts > 5:
-            # Even the best source is below minimum ROI
-            # Mark it exhausted and try again
-            best.exhausted = True
-            return self.next_source()  # Recursive: try next best
-        
-        return best.name
+        while True:
+            # Score every active source once; both branches below reuse it
+            active = [s for s in self.sources.values() if not s.exhausted]
+            if not active:
+                return None
+            prios = [s.eff_priority() for s in active]
+            best = active[prios.index(max(prios))]
+            
+            # Epsilon-greedy: explore vs exploit
+            if random.random() < self.epsilon and len(active) > 1:
+                # EXPLORE: pick a random source (not the best one)
+                others = [s for s in active if s.name != best.name]
+                if others:
+                    chosen = random.choice(others)
+                    return chosen.name
+            
+            # EXPLOIT: pick the source with highest effective priority
+            # Check minimum ROI before committing
+            roi = self.predict_roi(best.name)
+            if roi < self.min_roi and best.attempts > 5:
+                # Even the best source is below minimum ROI
+                # Mark it exhausted and try the next best
+                best.exhausted = True
+                best._eff_pri_cache = None
+                continue
+            
+            return best.name
     
     # ── Report results (feedback loop) ──
     
@@ -299,6 +327,8 @@ class CostEngine:
         if found > 0 and value == 0:
             value = found * 10.0
         
+        src._eff_pri_cache = None
+        self._dirty = True
         src.attempts += 1
         src.total_cost += cost
         self.total_actions += 1
@@ -331,7 +361,8 @@ class CostEngine:
         self.action_log.append(ActionLog(
             source=source_name, query=query, found=found,
             cost=cost, value=value, roi_predicted=roi,
-            decision=decision, timestamp=time.time()
+            decision=decision, timestamp=time.time(),
+            action_n=self.total_actions, cum_found=self.total_found,
         ))
     
     # ── Priority Queue: rank all pending actions ──
@@ -340,7 +371,7 @@ class CostEngine:
         """Return all sources ranked by effective priority.
         Useful for UI display."""
         ranked = sorted(self.sources.values(),
-                       key=lambda s: s.effective_priority, reverse=True)
+                       key=SourceStats.eff_priority, reverse=True)
         return [s.to_dict() for s in ranked]
     
     # ── Batch evaluation: should we scrape this URL? ──
@@ -379,6 +410,7 @@ class CostEngine:
     def summary(self) -> Dict:
         """Full summary for UI display and logging."""
         elapsed = time.time() - self.started_at
+        exhausted = self._count_exhausted()
         
         return {
             "status": "stopped" if self._stopped else "running",
@@ -392,14 +424,14 @@ class CostEngine:
             "budget_used_pct": round(self.total_actions / max(1, self.global_budget) * 100, 1),
             "efficiency": round(self.total_found / max(1, self.total_actions), 4),
             "sources": self.rank_sources(),
-            "active_sources": len([s for s in self.sources.values() if not s.exhausted]),
-            "exhausted_sources": len([s for s in self.sources.values() if s.exhausted]),
+            "active_sources": len(self.sources) - exhausted,
+            "exhausted_sources": exhausted,
         }
     
     def get_log(self, last_n: int = 50) -> List[Dict]:
         """Return recent action log entries."""
-        entries = self.action_log[-last_n:]
-        return [asdict(a) for a in entries]
+        log = self.action_log
+        return [asdict(a) for a in islice(log, max(0, len(log) - last_n), None)]
     
     def get_efficiency_curve(self) -> List[Dict]:
         """Returns cumulative efficiency over time for charting.
@@ -407,18 +439,13 @@ class CostEngine:
         Each point: {"action": N, "found": cumulative, "efficiency": found/action}
         Useful for plotting diminishing returns.
         """
-        curve = []
-        cumulative = 0
-        for i, log in enumerate(self.action_log):
-            cumulative += log.found
-            curve.append({
-                "action": i + 1,
-                "found": cumulative,
-                "efficiency": round(cumulative / (i + 1), 4),
-                "source": log.source,
-                "decision": log.decision,
-            })
-        return curve
+        return [{
+            "action": log.action_n,
+            "found": log.cum_found,
+            "efficiency": round(log.cum_found / max(1, log.action_n), 4),
+            "source": log.source,
+            "decision": log.decision,
+        } for log in self.action_log]
     
     # ── Serialization ──
     
@@ -445,20 +472,30 @@ class CostEngine:
             "summary": self.summary(),
         }
     
+    @staticmethod
+    def state_path(path: str = "") -> Path:
+        return Path(path) if path else (Path(BASE_DIR) / "RESULTATS" / "cost_engine_state.json")
+
+    def snapshot(self) -> Optional[Dict]:
+        """to_dict() if the state changed since the last save/snapshot, else None.
+        The dict shares nothing mutable with the engine: safe to serialize from another thread."""
+        if not self._dirty:
+            return None
+        self._dirty = False
+        return self.to_dict()
+
     def save(self, path: str = ""):
         """Save state to JSON file."""
-        p = Path(path) if path else (Path(BASE_DIR) / "RESULTATS" / "cost_engine_state.json")
-        p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text(json.dumps(self.to_dict(), indent=2, ensure_ascii=False), encoding="utf-8")
+        fast_json.write_atomic(self.state_path(path), self.to_dict(), indent=True)
+        self._dirty = False
     
     @classmethod
     def load(cls, path: str = "") -> "CostEngine":
         """Load state from JSON file."""
-        from config.settings import BASE_DIR
-        p = Path(path) if path else (Path(BASE_DIR) / "RESULTATS" / "cost_engine_state.json")
+        p = cls.state_path(path)
         if not p.exists():
             return cls()
-        data = json.loads(p.read_text(encoding="utf-8"))
+        data = fast_json.loads(p.read_bytes())
         cfg = data.get("config", {})
         engine = cls(**cfg)
         state = data.get("state", {})
@@ -476,4 +513,5 @@ class CostEngine:
                 exhausted=sd.get("exhausted", False), last_hit_at=sd.get("last_hit_at", 0),
                 created_at=sd.get("created_at", 0))
             engine.sources[name] = src
+        engine._dirty = False
         return engine
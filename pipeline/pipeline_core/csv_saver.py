@@ -1,86 +1,157 @@
 """pipeline/pipeline_core/csv_saver.py — Save search results as CSV files.
-Structure: RESULTATS/{state}/{city}/recherche_{category}.csv
+Structure: RESULTATS/{state}/{city}/recherche_{category}.csv (.csv.gz above CSV_GZIP_ROWS rows)
 """
-import csv, os, re
+import gzip, os, re
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict
-from config.settings import BASE_DIR
+from typing import List, Dict, Tuple
+from config.settings import BASE_DIR, CSV_GZIP_ROWS
 
 
+_SAFE_RE = re.compile(r'[^\w\s-]')
+
+
+@lru_cache(maxsize=4096)
 def safe_name(s: str) -> str:
-    """Sanitize string for use as folder/file name."""
-    return re.sub(r'[^\w\s-]', '', s).strip().replace(' ', '_')
+    """Sanitize string for use as folder/file name (few distinct inputs per run: cached)."""
+    return _SAFE_RE.sub('', s).strip().replace(' ', '_')
+
+
+_BOM = "\ufeff"  # utf-8-sig: Excel opens the files with the right encoding
+
+
+def _esc(v) -> str:
+    """One CSV cell, quoted only when needed (same output as csv.QUOTE_MINIMAL)."""
+    if v is None:
+        return ""
+    v = v if isinstance(v, str) else str(v)
+    if ',' in v or '"' in v or '\n' in v or '\r' in v:
+        return '"' + v.replace('"', '""') + '"'
+    return v
+
+
+def _write_csv(fpath: Path, fieldnames: List[str], lines: List[str]):
+    """Header + pre-formatted lines, written in one call (\r\n line ends, like csv.writer).
+    A single join builds the payload: no intermediate copy of the body before encoding.
+    Above CSV_GZIP_ROWS rows the file becomes {name}.csv.gz (level 1: cheap, most of the gain)."""
+    big = len(lines) > CSV_GZIP_ROWS
+    lines.insert(0, _BOM + ",".join(fieldnames) + "\r\n")
+    data = "".join(lines).encode("utf-8")
+    gz = fpath.with_name(fpath.name + ".gz")
+    target, stale = (gz, fpath) if big else (fpath, gz)
+    _write_bytes(target, gzip.compress(data, compresslevel=1) if big else data)
+    # Same file may have been written in the other form earlier: never leave both behind
+    try: os.unlink(stale)
+    except FileNotFoundError: pass
+
+
+_O_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_bytes(fpath: Path, data: bytes):
+    """open/write/close on a raw fd: the payload is already complete, so no buffered
+    file object (its fstat/ioctl/lseek on open) and exactly one write in the usual case."""
+    fd = os.open(fpath, _O_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+SEARCH_FIELDS = ["wave", "angle", "query", "url", "title", "snippet", "domain",
+                 "triage_score", "triage_reason", "page_num"]
+VERIFIED_FIELDS = ["channel_name", "channel_url", "subscribers", "city_score",
+                   "category_score", "total_score", "verified", "last_upload", "description"]
+
+
+def _search_lines(query_entries: List[Dict]) -> List[str]:
+    """One CSV line per URL (first query that found it), formatted directly (no per-row dict);
+    query-level cells escaped once."""
+    lines = []
+    seen = set()
+    for qe in query_entries:
+        prefix = f"{_esc(qe.get('wave', 1))},{_esc(qe.get('angle', ''))},{_esc(qe.get('query', ''))},"
+        for r in qe.get("results", []):
+            url = r.get("url", "")
+            if url:
+                if url in seen:
+                    continue
+                seen.add(url)
+            lines.append(f"{prefix}{_esc(r.get('url', ''))},{_esc(r.get('title', ''))},"
+                         f"{_esc(r.get('snippet', '')[:300])},{_esc(r.get('domain', ''))},"
+                         f"{_esc(r.get('score', ''))},{_esc(r.get('reason', ''))},{_esc(r.get('page_num', ''))}\r\n")
+    return lines
+
+
+def _verified_lines(candidates: List[Dict]) -> List[str]:
+    lines = []
+    for c in candidates:
+        lines.append(f"{_esc(c.get('channel_name') or c.get('yt_real_name', ''))},{_esc(c.get('channel_url', ''))},"
+                     f"{_esc(c.get('yt_subscribers_count') or c.get('yt_subscribers_text', ''))},"
+                     f"{_esc(c.get('city_score', ''))},{_esc(c.get('category_score', ''))},"
+                     f"{_esc(c.get('total_score', ''))},{_esc(c.get('verified', ''))},"
+                     f"{_esc(c.get('yt_last_upload_text', ''))},"
+                     f"{_esc((c.get('yt_description') or c.get('description', ''))[:200])}\r\n")
+    return lines
+
+
+def _city_dir(state: str, city: str) -> Path:
+    return BASE_DIR / "RESULTATS" / safe_name(state) / safe_name(city)
 
 
 def save_search_csv(state: str, city: str, category: str, query_entries: List[Dict]):
-    """Save all search results for one state/city/category to CSV.
+    """Save all search results for one state/city/category to CSV (one row per URL).
     
     query_entries: list of {query, angle, wave, results: [{url, title, snippet, domain, score, triage_reason}]}
     """
-    base = BASE_DIR / "RESULTATS" / safe_name(state) / safe_name(city)
-    base.mkdir(parents=True, exist_ok=True)
-    
-    fpath = base / f"recherche_{safe_name(category)}.csv"
-    
-    rows = []
-    for qe in query_entries:
-        query = qe.get("query", "")
-        angle = qe.get("angle", "")
-        wave = qe.get("wave", 1)
-        for r in qe.get("results", []):
-            rows.append({
-                "wave": wave,
-                "angle": angle,
-                "query": query,
-                "url": r.get("url", ""),
-                "title": r.get("title", ""),
-                "snippet": r.get("snippet", "")[:300],
-                "domain": r.get("domain", ""),
-                "triage_score": r.get("score", ""),
-                "triage_reason": r.get("reason", ""),
-                "page_num": r.get("page_num", ""),
-            })
-    
-    if not rows:
+    lines = _search_lines(query_entries)
+    if not lines:
         return
-    
-    fieldnames = ["wave", "angle", "query", "url", "title", "snippet", "domain",
-                  "triage_score", "triage_reason", "page_num"]
-    
-    with open(fpath, "w", newline="", encoding="utf-8-sig") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    base = _city_dir(state, city)
+    base.mkdir(parents=True, exist_ok=True)
+    _write_csv(base / f"recherche_{safe_name(category)}.csv", SEARCH_FIELDS, lines)
 
 
 def save_verified_csv(state: str, city: str, category: str, candidates: List[Dict]):
     """Save verified candidates for one category."""
-    base = BASE_DIR / "RESULTATS" / safe_name(state) / safe_name(city)
-    base.mkdir(parents=True, exist_ok=True)
-    
-    fpath = base / f"resultats_{safe_name(category)}.csv"
-    
-    rows = []
-    for c in candidates:
-        rows.append({
-            "channel_name": c.get("channel_name") or c.get("yt_real_name", ""),
-            "channel_url": c.get("channel_url", ""),
-            "subscribers": c.get("yt_subscribers_count") or c.get("yt_subscribers_text", ""),
-            "city_score": c.get("city_score", ""),
-            "category_score": c.get("category_score", ""),
-            "total_score": c.get("total_score", ""),
-            "verified": c.get("verified", ""),
-            "last_upload": c.get("yt_last_upload_text", ""),
-            "description": (c.get("yt_description") or c.get("description", ""))[:200],
-        })
-    
-    if not rows:
+    lines = _verified_lines(candidates)
+    if not lines:
         return
-    
-    fieldnames = ["channel_name", "channel_url", "subscribers", "city_score",
-                  "category_score", "total_score", "verified", "last_upload", "description"]
-    
-    with open(fpath, "w", newline="", encoding="utf-8-sig") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    base = _city_dir(state, city)
+    base.mkdir(parents=True, exist_ok=True)
+    _write_csv(base / f"resultats_{safe_name(category)}.csv", VERIFIED_FIELDS, lines)
+
+
+class CsvSaverSession:
+    """All CSVs of one (state, city): add_* only records the data, flush() writes every
+    file at once (one mkdir; a file added twice is written once, with the last data).
+
+        with CsvSaverSession(state, city) as sess:
+            sess.add_search(cat_key, query_entries)
+    """
+    def __init__(self, state: str, city: str):
+        self.base = _city_dir(state, city)
+        self._pending: Dict[str, Tuple[List[str], object, object]] = {}
+
+    def add_search(self, category: str, query_entries: List[Dict]):
+        self._pending[f"recherche_{safe_name(category)}.csv"] = (SEARCH_FIELDS, _search_lines, query_entries)
+
+    def add_verified(self, category: str, candidates: List[Dict]):
+        self._pending[f"resultats_{safe_name(category)}.csv"] = (VERIFIED_FIELDS, _verified_lines, candidates)
+
+    def flush(self):
+        pending, self._pending = self._pending, {}
+        files = [(name, fields, lines) for name, (fields, build, data) in pending.items() if (lines := build(data))]
+        if not files:
+            return
+        self.base.mkdir(parents=True, exist_ok=True)
+        for name, fields, lines in files:
+            _write_csv(self.base / name, fields, lines)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.flush()
@@ -4,45 +4,78 @@ INPUT: incomplete candidates | OUTPUT: updates candidates in-place with found UR
 Uses LLM to generate follow-up queries, then searches via HTTP as last resort.
 Browser-based follow-ups are handled in pipeline.py._followups() directly.
 """
-import json
+import asyncio
+from datetime import date, datetime
 from typing import List, Dict, Callable
 import aiohttp
 from prompts.followup_prompt import TEMPLATE
+from utils import fast_json
 from utils.logger import logger
 
 
+# Candidate fields the follow-up prompt can use (assembly output); quotes/sources/reasoning are left out
+_PROMPT_FIELDS = ("channel_name", "channel_url", "alternative_names", "city_evidence_strength",
+                  "subscriber_info", "missing_info")
+
+
+def _jsonable(v):
+    """Coerce the few non-JSON values a candidate can carry, so dumps needs no default= callback."""
+    if isinstance(v, (str, int, float, list, dict)) or v is None:
+        return v
+    if isinstance(v, (datetime, date)):
+        return v.isoformat()
+    return str(v)
+
+
 async def run_followups(incomplete: List[Dict], all_candidates: List[Dict],
-    session: aiohttp.ClientSession, llm_func: Callable, log: Callable):
-    """HTTP-based follow-up search (fallback when browser unavailable)."""
-    ctxt = json.dumps(incomplete[:5], indent=2, default=str)
+    session: aiohttp.ClientSession, llm_func: Callable, log: Callable, concurrency: int = 5):
+    """HTTP-based follow-up search (fallback when browser unavailable).
+    Follow-up queries run concurrently, at most `concurrency` in flight."""
+    slim = [{k: _jsonable(c[k]) for k in _PROMPT_FIELDS if c.get(k)} for c in incomplete[:5]]
+    ctxt = fast_json.dumps(slim, default=None, indent=True).decode()
     result = await llm_func(TEMPLATE.format(
         candidates_text=ctxt,
         missing_info="YouTube URL, city confirmation, subscriber count"))
     if not result or "followup_queries" not in result:
         return
 
-    for fq in result["followup_queries"][:10]:
+    sem = asyncio.Semaphore(concurrency)
+    # Candidates still missing a URL, names lowercased once (in all_candidates order)
+    open_cands = [((c.get("channel_name") or "").lower(), c) for c in all_candidates if not c.get("channel_url")]
+
+    async def one(fq):
         q = fq.get("query", "")
         cname = fq.get("for_candidate", "")
         if not q:
-            continue
-        log(f"          Follow-up '{cname}': {q[:60]}...")
-
-        # Simple HTTP search (may be blocked)
-        try:
-            from web_search.web_search_core.brave_search import brave_search_paginated
-            results = await brave_search_paginated(
-                q, session, max_pages=1,
-                log_func=lambda m: log(f"            {m}"))
-        except Exception as e:
-            log(f"            [HTTP FAILED] {str(e)[:60]}")
-            continue
+            return
+        cl = cname.lower()
+        async with sem:
+            # Only URL matches are used here: no open candidate matching cname -> nothing to gain
+            if not any(cl in name_l for name_l, _ in open_cands):
+                return
+            log(f"          Follow-up '{cname}': {q[:60]}...")
+
+            # Simple HTTP search (may be blocked)
+            try:
+                from web_search.web_search_core.brave_search import brave_search_paginated
+                results = await brave_search_paginated(
+                    q, session, max_pages=1,
+                    log_func=lambda m: log(f"            {m}"))
+            except Exception as e:
+                log(f"            [HTTP FAILED] {str(e)[:60]}")
+                return
 
         for r in results[:10]:
             url = r.get("url", "")
             if "youtube.com" in url:
-                for c in all_candidates:
-                    if not c.get("channel_url") and cname.lower() in c.get("channel_name", "").lower():
+                for i, (name_l, c) in enumerate(open_cands):
+                    if cl in name_l:
                         c["channel_url"] = url
+                        del open_cands[i]
                         log(f"            [FOUND URL] {url}")
                         break
+
+    # A malformed follow-up (e.g. a bare string from the LLM) must not cancel the others
+    for err in await asyncio.gather(*(one(fq) for fq in result["followup_queries"][:10]), return_exceptions=True):
+        if isinstance(err, Exception):
+            log(f"            [FOLLOW-UP ERROR] {str(err)[:60]}")
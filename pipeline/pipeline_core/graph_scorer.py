@@ -31,31 +31,90 @@ Generic enough for any OSINT: change criteria, entities become companies,
 targets become LinkedIn profiles, etc.
 """
 import sqlite3
-import json
+import threading
 import time
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Iterator, List, Dict, Optional, Tuple
 from config.settings import BASE_DIR
+from utils import fast_json
 
 
 DB_PATH = BASE_DIR / "RESULTATS" / "scout_graph.db"
 
+# Hot statements, one spelling each so every call hits the connection's prepared-statement cache
+# UPSERTs update rows in place (OR REPLACE = delete + insert: new rowid, twice the WAL frames)
+_SQL_INSERT_SCORE = """INSERT INTO scores(target_id, criterion_name, met, points_awarded,
+    evidence, computed_at) VALUES(?,?,?,?,?,?)
+    ON CONFLICT(target_id, criterion_name) DO UPDATE SET met=excluded.met,
+    points_awarded=excluded.points_awarded, evidence=excluded.evidence, computed_at=excluded.computed_at"""
+# details is not written: get_score/exports rebuild the breakdown from scores x criteria on demand
+_SQL_INSERT_TOTAL = """INSERT INTO score_totals(target_id, total, max_possible,
+    validated, threshold, computed_at) VALUES(?,?,?,?,?,?)
+    ON CONFLICT(target_id) DO UPDATE SET total=excluded.total, max_possible=excluded.max_possible,
+    validated=excluded.validated, threshold=excluded.threshold, computed_at=excluded.computed_at"""
+_SQL_SET_CONFIG = "INSERT INTO config(key, value) VALUES(?,?) ON CONFLICT(key) DO UPDATE SET value=excluded.value"
+_SQL_TARGET_SCORES = "SELECT criterion_name, met, points_awarded, evidence FROM scores WHERE target_id=?"
+_SQL_INSERT_TASK = """INSERT INTO tasks(type, target_type, entity_id, target_id, query,
+    status, priority, created_at) SELECT ?,?,?,?,?,?,?,?
+    WHERE NOT EXISTS (SELECT 1 FROM tasks WHERE type=? AND entity_id=? AND target_id=?
+                      AND status IN ('pending','running')) RETURNING id"""
+_SQL_OPEN_TASK = ("SELECT id FROM tasks WHERE type=? AND entity_id=? AND target_id=?"
+                  " AND status IN ('pending','running')")
+_SQL_WAS_DONE = "SELECT 1 FROM logs WHERE action=? AND key=?"
+_SQL_MARK_DONE = "INSERT OR IGNORE INTO logs(action, key, details, timestamp) VALUES(?,?,?,?)"
+
+
+def _dumps(obj, empty: str = "{}") -> str:
+    """JSON text for a TEXT column (orjson when installed). Empty/None binds the `empty`
+    literal without calling the encoder -- the default for most metadata/raw_data/keywords."""
+    return fast_json.dumps(obj).decode() if obj else empty
+
 
 class GraphScorer:
     """Generic graph-based scoring engine backed by SQLite."""
 
+    # targets columns by storage: INTEGER 0/1 (sqlite3 binds bool natively) / JSON TEXT
+    _TARGET_BOOL_COLS = frozenset(("is_active", "location_detected", "topic_detected", "is_creator"))
+    _TARGET_JSON_COLS = {"keywords": "[]", "external_links": "[]", "raw_data": "{}"}  # -> empty literal
+    _TARGET_COLS = _TARGET_BOOL_COLS | _TARGET_JSON_COLS.keys() | {
+        "name", "description", "followers", "last_activity", "entity_id", "platform"}
+
     def __init__(self, db_path: str = ""):
         self.db_path = Path(db_path) if db_path else DB_PATH
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._criteria_cache = None  # (version, criteria rows, threshold, {name: points})
         self._init_db()
 
     def _conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA foreign_keys=ON")
+        """This thread's connection, opened and tuned once then reused.
+        `with self._conn() as c:` still wraps each call in a transaction (commit/rollback)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), cached_statements=256)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")     # WAL: durable at checkpoints, no fsync per commit
+            conn.execute("PRAGMA wal_autocheckpoint=1000")  # pages; checkpoint() also runs off the hot path
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")    # 256 MB
+            conn.execute("PRAGMA cache_size=-65536")      # 64 MB
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
         return conn
 
+    def close(self):
+        """Close this thread's connection (reopened on next use)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def checkpoint(self) -> Tuple[int, int, int]:
+        """Passive WAL checkpoint (never waits on readers/writers) to keep the -wal file small.
+        Returns (busy, wal_pages, checkpointed_pages)."""
+        return tuple(self._conn().execute("PRAGMA wal_checkpoint(PASSIVE)").fetchone())
+
     def _init_db(self):
         with self._conn() as c:
             c.executescript("""
@@ -129,7 +188,7 @@ class GraphScorer:
                 max_possible INTEGER DEFAULT 0,
                 validated INTEGER DEFAULT 0,       -- 1 if total >= threshold
                 threshold INTEGER DEFAULT 60,
-                details TEXT DEFAULT '{}',          -- JSON breakdown
+                details TEXT DEFAULT '{}',          -- unused (legacy): breakdown is rebuilt from scores
                 computed_at REAL DEFAULT 0
             );
 
@@ -174,6 +233,11 @@ class GraphScorer:
             CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
             CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks(priority, status);
             CREATE INDEX IF NOT EXISTS idx_logs_key ON logs(action, key);
+            CREATE INDEX IF NOT EXISTS idx_entities_name_city ON entities(name, city);      -- add_entity dedup
+            CREATE INDEX IF NOT EXISTS idx_score_totals_validated_total ON score_totals(validated, total DESC);
+            CREATE INDEX IF NOT EXISTS idx_tasks_dedup ON tasks(type, entity_id, target_id, status);  -- add_task dedup
+            CREATE INDEX IF NOT EXISTS idx_tasks_pending ON tasks(priority, created_at) WHERE status='pending';
+            -- scores(target_id) is already covered by UNIQUE(target_id, criterion_name)
             """)
 
     # ══════════════════════════════════════
@@ -182,7 +246,9 @@ class GraphScorer:
 
     def set_config(self, key: str, value: str):
         with self._conn() as c:
-            c.execute("INSERT OR REPLACE INTO config(key,value) VALUES(?,?)", (key, value))
+            c.execute(_SQL_SET_CONFIG, (key, value))
+        if key == "threshold":
+            self._criteria_cache = None  # own commits don't bump data_version
 
     def get_config(self, key: str, default: str = "") -> str:
         with self._conn() as c:
@@ -194,22 +260,35 @@ class GraphScorer:
         
         criteria: [{"name": "diplome", "label": "Diplome confirme", "points": 30}, ...]
         """
+        rows = [(cr["name"], cr.get("label", cr["name"]), cr.get("description", ""),
+                 cr.get("points", 0), cr.get("category", "default"), i)
+                for i, cr in enumerate(criteria)]
         with self._conn() as c:
             c.execute("DELETE FROM criteria")
-            for i, cr in enumerate(criteria):
-                c.execute("""INSERT INTO criteria(name, label, description, points, category, sort_order)
-                    VALUES(?,?,?,?,?,?)""",
-                    (cr["name"], cr.get("label", cr["name"]), cr.get("description", ""),
-                     cr.get("points", 0), cr.get("category", "default"), i))
-            c.execute("INSERT OR REPLACE INTO config(key,value) VALUES('threshold',?)", (str(threshold),))
+            c.executemany("""INSERT INTO criteria(name, label, description, points, category, sort_order)
+                VALUES(?,?,?,?,?,?)""", rows)
+            c.execute(_SQL_SET_CONFIG, ("threshold", str(threshold)))
+        self._criteria_cache = None
+
+    def _criteria_state(self) -> Tuple[List[Dict], int, Dict[str, int]]:
+        """(criteria, threshold, {name: points}), read once and cached. Invalidated by
+        configure_criteria here, and by PRAGMA data_version when another connection
+        (e.g. the server's instance) commits."""
+        c = self._conn()
+        version = (id(c), c.execute("PRAGMA data_version").fetchone()[0])
+        cache = self._criteria_cache
+        if cache is None or cache[0] != version:
+            rows = [dict(r) for r in c.execute("SELECT * FROM criteria ORDER BY sort_order")]
+            r = c.execute("SELECT value FROM config WHERE key='threshold'").fetchone()
+            cache = self._criteria_cache = (version, rows, int(r["value"]) if r else 60,
+                                            {cr["name"]: cr["points"] for cr in rows})
+        return cache[1], cache[2], cache[3]
 
     def get_criteria(self) -> List[Dict]:
-        with self._conn() as c:
-            rows = c.execute("SELECT * FROM criteria ORDER BY sort_order").fetchall()
-            return [dict(r) for r in rows]
+        return [dict(cr) for cr in self._criteria_state()[0]]
 
     def get_threshold(self) -> int:
-        return int(self.get_config("threshold", "60"))
+        return self._criteria_state()[1]
 
     # ══════════════════════════════════════
     # ENTITIES
@@ -217,25 +296,36 @@ class GraphScorer:
 
     def add_entity(self, name: str, kind: str = "person", **kwargs) -> int:
         """Add an entity (person, org, etc). Returns entity ID."""
+        with self._conn() as c:
+            return self._insert_entity(c, name, kind, kwargs, time.time())
+
+    def add_entities_batch(self, rows: List[Dict]) -> List[int]:
+        """add_entity for many rows in one transaction. rows: [{"name", "kind", **kwargs}].
+        Returns entity IDs in row order."""
         now = time.time()
         with self._conn() as c:
-            # Dedup by name + city
-            existing = c.execute(
-                "SELECT id FROM entities WHERE name=? AND city=?",
-                (name, kwargs.get("city", ""))).fetchone()
-            if existing:
-                return existing["id"]
-            
-            r = c.execute("""INSERT INTO entities(name, kind, subkind, city, state, country,
-                institution, year, source_url, source_type, status, metadata, created_at, updated_at)
-                VALUES(?,?,?,?,?,?,?,?,?,?,?,?,?,?)""",
-                (name, kind, kwargs.get("subkind", ""), kwargs.get("city", ""),
-                 kwargs.get("state", ""), kwargs.get("country", ""),
-                 kwargs.get("institution", ""), kwargs.get("year", 0),
-                 kwargs.get("source_url", ""), kwargs.get("source_type", ""),
-                 kwargs.get("status", "found"),
-                 json.dumps(kwargs.get("metadata", {})), now, now))
-            return r.lastrowid
+            return [self._insert_entity(c, r["name"], r.get("kind", "person"),
+                                        {k: v for k, v in r.items() if k not in ("name", "kind")}, now)
+                    for r in rows]
+
+    @staticmethod
+    def _insert_entity(c: sqlite3.Connection, name: str, kind: str, kwargs: Dict, now: float) -> int:
+        # Dedup by name + city: insert-if-absent in one statement, look up only on a hit.
+        # (No UNIQUE(name, city): older DBs may already hold duplicates.)
+        city = kwargs.get("city", "")
+        r = c.execute("""INSERT INTO entities(name, kind, subkind, city, state, country,
+            institution, year, source_url, source_type, status, metadata, created_at, updated_at)
+            SELECT ?,?,?,?,?,?,?,?,?,?,?,?,?,?
+            WHERE NOT EXISTS (SELECT 1 FROM entities WHERE name=? AND city=?) RETURNING id""",
+            (name, kind, kwargs.get("subkind", ""), city,
+             kwargs.get("state", ""), kwargs.get("country", ""),
+             kwargs.get("institution", ""), kwargs.get("year", 0),
+             kwargs.get("source_url", ""), kwargs.get("source_type", ""),
+             kwargs.get("status", "found"),
+             _dumps(kwargs.get("metadata")), now, now, name, city)).fetchone()
+        if r:
+            return r[0]
+        return c.execute("SELECT id FROM entities WHERE name=? AND city=?", (name, city)).fetchone()[0]
 
     def update_entity(self, entity_id: int, **kwargs):
         with self._conn() as c:
@@ -245,7 +335,7 @@ class GraphScorer:
                 if k in ("name","kind","subkind","city","state","country","institution",
                          "year","source_url","source_type","status","metadata"):
                     sets.append(f"{k}=?")
-                    vals.append(json.dumps(v) if k == "metadata" else v)
+                    vals.append(_dumps(v) if k == "metadata" else v)
             if sets:
                 sets.append("updated_at=?")
                 vals.append(time.time())
@@ -258,7 +348,8 @@ class GraphScorer:
             return dict(r) if r else None
 
     def find_entities(self, status: str = "", city: str = "", kind: str = "",
-                      limit: int = 500) -> List[Dict]:
+                      limit: int = 500, raw: bool = False) -> List[Dict]:
+        """raw=True returns the sqlite3.Row objects (index + name access) without copying to dicts."""
         with self._conn() as c:
             where, params = [], []
             if status: where.append("status=?"); params.append(status)
@@ -267,7 +358,8 @@ class GraphScorer:
             sql = "SELECT * FROM entities"
             if where: sql += " WHERE " + " AND ".join(where)
             sql += f" ORDER BY created_at DESC LIMIT {limit}"
-            return [dict(r) for r in c.execute(sql, params).fetchall()]
+            rows = c.execute(sql, params).fetchall()
+            return rows if raw else [dict(r) for r in rows]
 
     def count_entities(self, status: str = "") -> int:
         with self._conn() as c:
@@ -283,43 +375,54 @@ class GraphScorer:
                    **kwargs) -> int:
         """Add a target (channel, profile, website). Returns target ID."""
         with self._conn() as c:
-            existing = c.execute("SELECT id FROM targets WHERE url=?", (url,)).fetchone()
-            if existing:
-                # Link to entity if not already linked
-                if entity_id:
-                    c.execute("UPDATE targets SET entity_id=? WHERE id=? AND entity_id=0",
-                              (entity_id, existing["id"]))
-                return existing["id"]
-            
-            r = c.execute("""INSERT INTO targets(entity_id, platform, url, name, description,
-                followers, last_activity, is_active, keywords, location_detected, topic_detected,
-                is_creator, external_links, raw_data, scanned_at)
-                VALUES(?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""",
-                (entity_id, platform, url,
-                 kwargs.get("name", ""), kwargs.get("description", ""),
-                 kwargs.get("followers", 0), kwargs.get("last_activity", ""),
-                 int(kwargs.get("is_active", False)),
-                 json.dumps(kwargs.get("keywords", [])),
-                 int(kwargs.get("location_detected", False)),
-                 int(kwargs.get("topic_detected", False)),
-                 int(kwargs.get("is_creator", False)),
-                 json.dumps(kwargs.get("external_links", [])),
-                 json.dumps(kwargs.get("raw_data", {})),
-                 time.time()))
-            return r.lastrowid
+            return self._insert_target(c, url, entity_id, platform, kwargs, time.time())
+
+    def add_targets_batch(self, rows: List[Dict]) -> List[int]:
+        """add_target for many rows in one transaction. rows: [{"url", "entity_id", "platform", **kwargs}].
+        Returns target IDs in row order."""
+        now = time.time()
+        with self._conn() as c:
+            return [self._insert_target(c, r["url"], r.get("entity_id", 0), r.get("platform", "youtube"),
+                                        {k: v for k, v in r.items() if k not in ("url", "entity_id", "platform")},
+                                        now)
+                    for r in rows]
+
+    @staticmethod
+    def _insert_target(c: sqlite3.Connection, url: str, entity_id: int, platform: str,
+                       kwargs: Dict, now: float) -> int:
+        # Dedup on UNIQUE(url); an existing unlinked target gets linked to entity_id.
+        # RETURNING is empty only when the url exists and no link was made.
+        r = c.execute("""INSERT INTO targets(entity_id, platform, url, name, description,
+            followers, last_activity, is_active, keywords, location_detected, topic_detected,
+            is_creator, external_links, raw_data, scanned_at)
+            VALUES(?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+            ON CONFLICT(url) DO UPDATE SET entity_id=excluded.entity_id
+            WHERE targets.entity_id=0 AND excluded.entity_id<>0 RETURNING id""",
+            (entity_id, platform, url,
+             kwargs.get("name", ""), kwargs.get("description", ""),
+             kwargs.get("followers", 0), kwargs.get("last_activity", ""),
+             bool(kwargs.get("is_active")),
+             _dumps(kwargs.get("keywords"), "[]"),
+             bool(kwargs.get("location_detected")),
+             bool(kwargs.get("topic_detected")),
+             bool(kwargs.get("is_creator")),
+             _dumps(kwargs.get("external_links"), "[]"),
+             _dumps(kwargs.get("raw_data")),
+             now)).fetchone()
+        if r:
+            return r[0]
+        return c.execute("SELECT id FROM targets WHERE url=?", (url,)).fetchone()[0]
 
     def update_target(self, target_id: int, **kwargs):
         with self._conn() as c:
             sets, vals = [], []
             for k, v in kwargs.items():
-                if k in ("name","description","followers","last_activity","is_active",
-                         "keywords","location_detected","topic_detected","is_creator",
-                         "external_links","raw_data","entity_id","platform"):
+                if k in self._TARGET_COLS:
                     sets.append(f"{k}=?")
-                    if k in ("keywords","external_links","raw_data"):
-                        vals.append(json.dumps(v))
-                    elif k in ("is_active","location_detected","topic_detected","is_creator"):
-                        vals.append(int(v))
+                    if k in self._TARGET_JSON_COLS:
+                        vals.append(_dumps(v, self._TARGET_JSON_COLS[k]))
+                    elif k in self._TARGET_BOOL_COLS:
+                        vals.append(bool(v))
                     else:
                         vals.append(v)
             if sets:
@@ -332,8 +435,8 @@ class GraphScorer:
             r = c.execute("SELECT * FROM targets WHERE id=?", (target_id,)).fetchone()
             if not r: return None
             d = dict(r)
-            d["keywords"] = json.loads(d.get("keywords","[]"))
-            d["external_links"] = json.loads(d.get("external_links","[]"))
+            d["keywords"] = fast_json.loads(d.get("keywords","[]"))
+            d["external_links"] = fast_json.loads(d.get("external_links","[]"))
             return d
 
     def get_targets_for_entity(self, entity_id: int) -> List[Dict]:
@@ -343,8 +446,8 @@ class GraphScorer:
             return [dict(r) for r in rows]
 
     def find_targets(self, platform: str = "", validated: Optional[bool] = None,
-                     min_score: int = 0, limit: int = 500) -> List[Dict]:
-        """Find targets with optional filtering by score validation."""
+                     min_score: int = 0, limit: int = 500, raw: bool = False) -> List[Dict]:
+        """Find targets with optional filtering by score validation. raw=True: sqlite3.Row objects."""
         with self._conn() as c:
             sql = """SELECT t.*, st.total as score_total, st.validated as score_validated,
                      e.name as entity_name, e.city as entity_city, e.institution as entity_institution
@@ -352,12 +455,16 @@ class GraphScorer:
                      LEFT JOIN score_totals st ON st.target_id = t.id
                      LEFT JOIN entities e ON e.id = t.entity_id"""
             where, params = [], []
+            # A validated filter implies a score_totals row: plain st.total lets the planner
+            # walk idx_score_totals_validated_total in order (range on min_score, no sort)
+            total = "COALESCE(st.total,0)" if validated is None else "st.total"
             if platform: where.append("t.platform=?"); params.append(platform)
             if validated is not None: where.append("st.validated=?"); params.append(int(validated))
-            if min_score: where.append("COALESCE(st.total,0)>=?"); params.append(min_score)
+            if min_score: where.append(f"{total}>=?"); params.append(min_score)
             if where: sql += " WHERE " + " AND ".join(where)
-            sql += f" ORDER BY COALESCE(st.total,0) DESC LIMIT {limit}"
-            return [dict(r) for r in c.execute(sql, params).fetchall()]
+            sql += f" ORDER BY {total} DESC LIMIT {limit}"
+            rows = c.execute(sql, params).fetchall()
+            return rows if raw else [dict(r) for r in rows]
 
     # ══════════════════════════════════════
     # SCORING
@@ -366,74 +473,111 @@ class GraphScorer:
     def set_criterion(self, target_id: int, criterion_name: str, met: bool,
                       evidence: str = ""):
         """Set whether a criterion is met for a target."""
+        pts = self._criteria_state()[2].get(criterion_name, 0) if met else 0
+        with self._conn() as c:
+            c.execute(_SQL_INSERT_SCORE, (target_id, criterion_name, int(met), pts, evidence, time.time()))
+
+    def set_criteria_batch(self, rows: List[Tuple]):
+        """set_criterion for many (target_id, criterion_name, met[, evidence]) rows in one transaction."""
+        now = time.time()
+        points = self._criteria_state()[2]
         with self._conn() as c:
-            cr = c.execute("SELECT points FROM criteria WHERE name=?", (criterion_name,)).fetchone()
-            pts = cr["points"] if cr and met else 0
-            c.execute("""INSERT OR REPLACE INTO scores(target_id, criterion_name, met, points_awarded,
-                evidence, computed_at) VALUES(?,?,?,?,?,?)""",
-                (target_id, criterion_name, int(met), pts, evidence, time.time()))
+            c.executemany(_SQL_INSERT_SCORE,
+                [(r[0], r[1], int(r[2]), points.get(r[1], 0) if r[2] else 0,
+                  r[3] if len(r) > 3 else "", now) for r in rows])
 
     def compute_score(self, target_id: int) -> Dict:
         """Compute total score for a target based on all criteria."""
+        criteria, threshold, _ = self._criteria_state()
         with self._conn() as c:
-            criteria = c.execute("SELECT * FROM criteria ORDER BY sort_order").fetchall()
-            threshold = int(self.get_config("threshold", "60"))
-            
-            total = 0
-            max_possible = 0
-            details = {}
-            
-            for cr in criteria:
-                max_possible += cr["points"]
-                sc = c.execute("SELECT * FROM scores WHERE target_id=? AND criterion_name=?",
-                               (target_id, cr["name"])).fetchone()
-                awarded = sc["points_awarded"] if sc else 0
-                met = bool(sc["met"]) if sc else False
-                total += awarded
-                details[cr["name"]] = {
-                    "label": cr["label"],
-                    "max": cr["points"],
-                    "awarded": awarded,
-                    "met": met,
-                    "evidence": sc["evidence"] if sc else "",
-                }
-            
-            validated = total >= threshold
-            
-            c.execute("""INSERT OR REPLACE INTO score_totals(target_id, total, max_possible,
-                validated, threshold, details, computed_at) VALUES(?,?,?,?,?,?,?)""",
-                (target_id, total, max_possible, int(validated),
-                 threshold, json.dumps(details), time.time()))
-            
-            # Update entity status
-            t = c.execute("SELECT entity_id FROM targets WHERE id=?", (target_id,)).fetchone()
-            if t and t["entity_id"]:
-                new_status = "validated" if validated else "scored"
-                c.execute("UPDATE entities SET status=?, updated_at=? WHERE id=?",
-                          (new_status, time.time(), t["entity_id"]))
-            
-            return {"target_id": target_id, "total": total, "max_possible": max_possible,
-                    "validated": validated, "threshold": threshold, "details": details}
-
-    def get_score(self, target_id: int) -> Optional[Dict]:
+            return self._compute_score(c, target_id, criteria, threshold)
+
+    def compute_scores_batch(self, target_ids: List[int]) -> List[Dict]:
+        """compute_score for many targets in one transaction (criteria + threshold read once)."""
+        criteria, threshold, _ = self._criteria_state()
+        with self._conn() as c:
+            return [self._compute_score(c, tid, criteria, threshold) for tid in target_ids]
+
+    @staticmethod
+    def _score_details(criteria: List, scores: Dict) -> Tuple[int, int, Dict]:
+        """(total, max_possible, details) from criteria rows and {criterion_name: score row}."""
+        total = 0
+        max_possible = 0
+        details = {}
+        for cr in criteria:
+            max_possible += cr["points"]
+            sc = scores.get(cr["name"])
+            awarded = sc["points_awarded"] if sc else 0
+            total += awarded
+            details[cr["name"]] = {
+                "label": cr["label"],
+                "max": cr["points"],
+                "awarded": awarded,
+                "met": bool(sc["met"]) if sc else False,
+                "evidence": sc["evidence"] if sc else "",
+            }
+        return total, max_possible, details
+
+    @staticmethod
+    def _compute_score(c: sqlite3.Connection, target_id: int, criteria: List, threshold: int) -> Dict:
+        scores = {r["criterion_name"]: r for r in c.execute(_SQL_TARGET_SCORES, (target_id,))}
+        total, max_possible, details = GraphScorer._score_details(criteria, scores)
+
+        validated = total >= threshold
+
+        c.execute(_SQL_INSERT_TOTAL, (target_id, total, max_possible, int(validated),
+                                      threshold, time.time()))
+
+        # Update entity status
+        t = c.execute("SELECT entity_id FROM targets WHERE id=?", (target_id,)).fetchone()
+        if t and t["entity_id"]:
+            new_status = "validated" if validated else "scored"
+            c.execute("UPDATE entities SET status=?, updated_at=? WHERE id=?",
+                      (new_status, time.time(), t["entity_id"]))
+
+        return {"target_id": target_id, "total": total, "max_possible": max_possible,
+                "validated": validated, "threshold": threshold, "details": details}
+
+    def get_score(self, target_id: int, details: bool = True) -> Optional[Dict]:
+        """Cached total for a target; details=True rebuilds the per-criterion breakdown
+        from the current criteria and scores rows."""
         with self._conn() as c:
             r = c.execute("SELECT * FROM score_totals WHERE target_id=?", (target_id,)).fetchone()
             if not r: return None
             d = dict(r)
-            d["details"] = json.loads(d.get("details","{}"))
+            if details:
+                scores = {s["criterion_name"]: s for s in c.execute(_SQL_TARGET_SCORES, (target_id,))}
+                d["details"] = self._score_details(self._criteria_state()[0], scores)[2]
+            else:
+                d.pop("details", None)
             return d
 
     def compute_all_scores(self) -> Dict:
-        """Recompute scores for all targets. Returns summary."""
+        """Recompute scores for all targets. Returns summary.
+        One transaction, fixed number of statements: every score row is read in one query,
+        totals and entity statuses are written with executemany (no per-target round trips)."""
+        criteria, threshold, points = self._criteria_state()
+        max_possible = sum(points.values())
         with self._conn() as c:
-            targets = c.execute("SELECT id FROM targets").fetchall()
-            total = len(targets)
+            by_target: Dict[int, int] = {}
+            for tid, name, awarded in c.execute("SELECT target_id, criterion_name, points_awarded FROM scores"):
+                if name in points:
+                    by_target[tid] = by_target.get(tid, 0) + awarded
+            targets = c.execute("SELECT id, entity_id FROM targets ORDER BY id").fetchall()
+            now = time.time()
+            totals, statuses = [], []
             validated = 0
             for t in targets:
-                result = self.compute_score(t["id"])
-                if result["validated"]:
-                    validated += 1
-            return {"total_targets": total, "validated": validated, "rejected": total - validated}
+                total = by_target.get(t["id"], 0)
+                ok = total >= threshold
+                validated += ok
+                totals.append((t["id"], total, max_possible, int(ok), threshold, now))
+                if t["entity_id"]:
+                    # Same order as per-target compute_score: the entity's last target decides
+                    statuses.append(("validated" if ok else "scored", now, t["entity_id"]))
+            c.executemany(_SQL_INSERT_TOTAL, totals)
+            c.executemany("UPDATE entities SET status=?, updated_at=? WHERE id=?", statuses)
+            return {"total_targets": len(targets), "validated": validated, "rejected": len(targets) - validated}
 
     # ══════════════════════════════════════
     # TASK QUEUE
@@ -443,22 +587,19 @@ class GraphScorer:
                  query: str = "", priority: int = 5, target_type: str = "") -> int:
         """Add a task to the queue."""
         with self._conn() as c:
-            # Dedup: don't add same task twice
-            existing = c.execute(
-                "SELECT id FROM tasks WHERE type=? AND entity_id=? AND target_id=? AND status IN ('pending','running')",
-                (task_type, entity_id, target_id)).fetchone()
-            if existing:
-                return existing["id"]
-            
-            r = c.execute("""INSERT INTO tasks(type, target_type, entity_id, target_id, query,
-                status, priority, created_at) VALUES(?,?,?,?,?,?,?,?)""",
-                (task_type, target_type, entity_id, target_id, query, "pending", priority, time.time()))
-            return r.lastrowid
+            # Dedup: don't add same task twice (open = pending or running)
+            r = c.execute(_SQL_INSERT_TASK,
+                (task_type, target_type, entity_id, target_id, query, "pending", priority, time.time(),
+                 task_type, entity_id, target_id)).fetchone()
+            if r:
+                return r[0]
+            return c.execute(_SQL_OPEN_TASK, (task_type, entity_id, target_id)).fetchone()[0]
 
     def get_next_task(self) -> Optional[Dict]:
         """Get next pending task (highest priority first)."""
         with self._conn() as c:
-            r = c.execute("""SELECT * FROM tasks WHERE status='pending'
+            # Ordered walk of the pending-only partial index, no sort step
+            r = c.execute("""SELECT * FROM tasks INDEXED BY idx_tasks_pending WHERE status='pending'
                 ORDER BY priority ASC, created_at ASC LIMIT 1""").fetchone()
             if not r: return None
             c.execute("UPDATE tasks SET status='running', started_at=? WHERE id=?",
@@ -469,13 +610,14 @@ class GraphScorer:
         with self._conn() as c:
             status = "failed" if error else "done"
             c.execute("UPDATE tasks SET status=?, result=?, error=?, completed_at=? WHERE id=?",
-                      (status, json.dumps(result or {}), error, time.time(), task_id))
+                      (status, _dumps(result), error, time.time(), task_id))
 
     def count_tasks(self, status: str = "pending") -> int:
         with self._conn() as c:
             return c.execute("SELECT COUNT(*) FROM tasks WHERE status=?", (status,)).fetchone()[0]
 
-    def get_tasks(self, status: str = "", limit: int = 100) -> List[Dict]:
+    def get_tasks(self, status: str = "", limit: int = 100, raw: bool = False) -> List[Dict]:
+        """raw=True returns the sqlite3.Row objects without copying to dicts."""
         with self._conn() as c:
             if status:
                 rows = c.execute("SELECT * FROM tasks WHERE status=? ORDER BY created_at DESC LIMIT ?",
@@ -483,111 +625,113 @@ class GraphScorer:
             else:
                 rows = c.execute("SELECT * FROM tasks ORDER BY created_at DESC LIMIT ?",
                                  (limit,)).fetchall()
-            return [dict(r) for r in rows]
+            return rows if raw else [dict(r) for r in rows]
 
     # ══════════════════════════════════════
     # LOGS (deduplication)
     # ══════════════════════════════════════
 
     def was_done(self, action: str, key: str) -> bool:
-        """Check if an action was already done (for dedup)."""
-        with self._conn() as c:
-            return c.execute("SELECT 1 FROM logs WHERE action=? AND key=?",
-                             (action, key)).fetchone() is not None
+        """Check if an action was already done (for dedup). One point lookup on the
+        UNIQUE(action, key) index through a cached statement -- no in-memory mirror, so
+        writes from other connections/processes are always seen."""
+        return self._conn().execute(_SQL_WAS_DONE, (action, key)).fetchone() is not None
 
     def mark_done(self, action: str, key: str, details: str = ""):
         with self._conn() as c:
-            c.execute("INSERT OR IGNORE INTO logs(action, key, details, timestamp) VALUES(?,?,?,?)",
-                      (action, key, details, time.time()))
+            c.execute(_SQL_MARK_DONE, (action, key, details, time.time()))
 
     # ══════════════════════════════════════
     # STATISTICS & EXPORT
     # ══════════════════════════════════════
 
     def get_stats(self) -> Dict:
-        """Get overall statistics for UI display."""
+        """Get overall statistics for UI display.
+        One UNION ALL of GROUP BYs (one pass per table); totals are sums of the groups."""
         with self._conn() as c:
-            stats = {
-                "entities": {
-                    "total": c.execute("SELECT COUNT(*) FROM entities").fetchone()[0],
-                    "by_status": {},
-                },
-                "targets": {
-                    "total": c.execute("SELECT COUNT(*) FROM targets").fetchone()[0],
-                    "by_platform": {},
-                },
-                "scores": {
-                    "validated": c.execute("SELECT COUNT(*) FROM score_totals WHERE validated=1").fetchone()[0],
-                    "rejected": c.execute("SELECT COUNT(*) FROM score_totals WHERE validated=0").fetchone()[0],
-                    "unscored": 0,
-                    "avg_score": 0,
-                },
-                "tasks": {
-                    "pending": c.execute("SELECT COUNT(*) FROM tasks WHERE status='pending'").fetchone()[0],
-                    "running": c.execute("SELECT COUNT(*) FROM tasks WHERE status='running'").fetchone()[0],
-                    "done": c.execute("SELECT COUNT(*) FROM tasks WHERE status='done'").fetchone()[0],
-                    "failed": c.execute("SELECT COUNT(*) FROM tasks WHERE status='failed'").fetchone()[0],
-                },
-                "criteria": self.get_criteria(),
-                "threshold": self.get_threshold(),
-            }
-            # By status
-            for r in c.execute("SELECT status, COUNT(*) as cnt FROM entities GROUP BY status").fetchall():
-                stats["entities"]["by_status"][r["status"]] = r["cnt"]
-            # By platform
-            for r in c.execute("SELECT platform, COUNT(*) as cnt FROM targets GROUP BY platform").fetchall():
-                stats["targets"]["by_platform"][r["platform"]] = r["cnt"]
-            # Avg score
-            avg = c.execute("SELECT AVG(total) FROM score_totals").fetchone()[0]
-            stats["scores"]["avg_score"] = round(avg, 1) if avg else 0
-            scored_count = stats["scores"]["validated"] + stats["scores"]["rejected"]
-            stats["scores"]["unscored"] = stats["targets"]["total"] - scored_count
-            
-            return stats
+            rows = c.execute("""
+                SELECT 'entities' cat, status k, COUNT(*) v FROM entities GROUP BY status
+                UNION ALL SELECT 'targets', platform, COUNT(*) FROM targets GROUP BY platform
+                UNION ALL SELECT 'tasks', status, COUNT(*) FROM tasks GROUP BY status
+                UNION ALL SELECT 'scores', validated, COUNT(*) FROM score_totals GROUP BY validated
+                UNION ALL SELECT 'avg', NULL, AVG(total) FROM score_totals""").fetchall()
+        groups = {"entities": {}, "targets": {}, "tasks": {}, "scores": {}}
+        avg = None
+        for cat, k, v in rows:
+            if cat == "avg":
+                avg = v
+            else:
+                groups[cat][k] = v
+        tasks, scores = groups["tasks"], groups["scores"]
+        validated, rejected = scores.get(1, 0), scores.get(0, 0)
+        n_targets = sum(groups["targets"].values())
+        criteria, threshold, _ = self._criteria_state()
+        return {
+            "entities": {"total": sum(groups["entities"].values()), "by_status": groups["entities"]},
+            "targets": {"total": n_targets, "by_platform": groups["targets"]},
+            "scores": {
+                "validated": validated,
+                "rejected": rejected,
+                "unscored": n_targets - validated - rejected,
+                "avg_score": round(avg, 1) if avg else 0,
+            },
+            "tasks": {st: tasks.get(st, 0) for st in ("pending", "running", "done", "failed")},
+            "criteria": [dict(cr) for cr in criteria],
+            "threshold": threshold,
+        }
+
+    _EXPORT_VALIDATED_SQL = """
+        SELECT t.*, e.name as entity_name, e.kind as entity_kind,
+               e.institution, e.year, e.city, e.state,
+               st.total as score, st.max_possible, st.target_id as _scored
+        FROM targets t
+        JOIN score_totals st ON st.target_id = t.id
+        LEFT JOIN entities e ON e.id = t.entity_id
+        WHERE st.validated = 1
+        ORDER BY st.total DESC"""
+
+    _EXPORT_ALL_SQL = """
+        SELECT t.*, e.name as entity_name, e.kind as entity_kind,
+               e.institution, e.year, e.city, e.state,
+               COALESCE(st.total, 0) as score,
+               COALESCE(st.max_possible, 0) as max_possible,
+               COALESCE(st.validated, 0) as validated,
+               st.target_id as _scored
+        FROM targets t
+        LEFT JOIN score_totals st ON st.target_id = t.id
+        LEFT JOIN entities e ON e.id = t.entity_id
+        ORDER BY COALESCE(st.total, 0) DESC"""
+
+    def _iter_export(self, sql: str) -> Iterator[Dict]:
+        # Rows are decoded one at a time while the cursor streams: no full fetchall() list.
+        # score_details is rebuilt from one pass over scores ({} for never-scored targets).
+        c = self._conn()
+        criteria = self._criteria_state()[0]
+        by_target: Dict[int, Dict] = {}
+        for sc in c.execute("SELECT target_id, criterion_name, met, points_awarded, evidence FROM scores"):
+            by_target.setdefault(sc["target_id"], {})[sc["criterion_name"]] = sc
+        for r in c.execute(sql):
+            d = dict(r)
+            d["score_details"] = self._score_details(criteria, by_target.get(d["id"], {}))[2] \
+                if d.pop("_scored") is not None else {}
+            d["keywords"] = fast_json.loads(d.get("keywords") or "[]")
+            yield d
+
+    def iter_export_validated(self) -> Iterator[Dict]:
+        """export_validated() as a generator."""
+        return self._iter_export(self._EXPORT_VALIDATED_SQL)
+
+    def iter_export_all(self) -> Iterator[Dict]:
+        """export_all() as a generator."""
+        return self._iter_export(self._EXPORT_ALL_SQL)
 
     def export_validated(self) -> List[Dict]:
         """Export all validated targets with full details for CSV/JSON."""
-        with self._conn() as c:
-            rows = c.execute("""
-                SELECT t.*, e.name as entity_name, e.kind as entity_kind,
-                       e.institution, e.year, e.city, e.state,
-                       st.total as score, st.max_possible, st.details as score_details
-                FROM targets t
-                JOIN score_totals st ON st.target_id = t.id
-                LEFT JOIN entities e ON e.id = t.entity_id
-                WHERE st.validated = 1
-                ORDER BY st.total DESC
-            """).fetchall()
-            results = []
-            for r in rows:
-                d = dict(r)
-                d["score_details"] = json.loads(d.get("score_details","{}"))
-                d["keywords"] = json.loads(d.get("keywords","[]"))
-                results.append(d)
-            return results
+        return list(self.iter_export_validated())
 
     def export_all(self) -> List[Dict]:
         """Export ALL targets (validated + rejected) with scores."""
-        with self._conn() as c:
-            rows = c.execute("""
-                SELECT t.*, e.name as entity_name, e.kind as entity_kind,
-                       e.institution, e.year, e.city, e.state,
-                       COALESCE(st.total, 0) as score,
-                       COALESCE(st.max_possible, 0) as max_possible,
-                       COALESCE(st.validated, 0) as validated,
-                       COALESCE(st.details, '{}') as score_details
-                FROM targets t
-                LEFT JOIN score_totals st ON st.target_id = t.id
-                LEFT JOIN entities e ON e.id = t.entity_id
-                ORDER BY COALESCE(st.total, 0) DESC
-            """).fetchall()
-            results = []
-            for r in rows:
-                d = dict(r)
-                d["score_details"] = json.loads(d.get("score_details","{}"))
-                d["keywords"] = json.loads(d.get("keywords","[]"))
-                results.append(d)
-            return results
+        return list(self.iter_export_all())
 
     def reset(self):
         """Clear all data (for testing)."""
@@ -11,7 +11,7 @@ async def generate_queries(city: str, state: str, cat_key: str, cat_label: str,
     prev_ctx = ""
     if wave > 1 and prev_queries:
         prev_ctx = f"PREVIOUS WAVE FAILED. Queries tried: {json.dumps([q.get('query','') for q in prev_queries[-8:]])}. Use COMPLETELY DIFFERENT queries with different angles."
-    terms = ", ".join(CATEGORY_SEARCH_TERMS.get(cat_key, []))
+    terms = ", ".join(CATEGORY_SEARCH_TERMS.get(cat_key, ()))
     result = await llm_func(TEMPLATE.format(city=city, state=state, category_label=cat_label,
         wave_number=wave, previous_wave_context=prev_ctx, category_terms=terms))
 
@@ -54,7 +54,7 @@ def _dedup_queries(queries: List[Dict]) -> List[Dict]:
     return unique
 
 def fallback_queries(city, state, cat_key, wave) -> List[Dict]:
-    t = CATEGORY_SEARCH_TERMS.get(cat_key, ["content creator"])
+    t = CATEGORY_SEARCH_TERMS.get(cat_key, ("content creator",))
     t1 = t[0]; t2 = t[1] if len(t)>1 else t[0]; t3 = t[2] if len(t)>2 else t1
     if wave == 1:
         return [
@@ -36,6 +36,7 @@ from dataclasses import dataclass, field, asdict
 from pathlib import Path
 
 from config.settings import BASE_DIR
+from utils import fast_json
 
 
 # ══════════════════════════════════════
@@ -492,7 +493,7 @@ class StrategyPlanner:
             "query_counts": self.count_queries(),
             "generated_at": time.time(),
         }
-        p.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        p.write_bytes(fast_json.dumps(data, indent=True))
         return str(p)
 
     @classmethod
@@ -500,7 +501,7 @@ class StrategyPlanner:
         """Load saved plan."""
         p = Path(path) if path else (Path(BASE_DIR) / "RESULTATS" / "strategy_plan.json")
         if p.exists():
-            return json.loads(p.read_text(encoding="utf-8"))
+            return fast_json.loads(p.read_bytes())
         return {}
 
     # ── Format for display ──
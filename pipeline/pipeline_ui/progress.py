@@ -6,7 +6,9 @@ from server.server_core.state import app_state
 def progress_callback(data: dict):
     dtype = data.get("type","")
     if dtype == "state_progress":
-        app_state.progress["current_state"] = data.get("state","")
+        # With states running concurrently, run_full_scan keeps current_state = all active states
+        if not app_state.progress.get("active_states"):
+            app_state.progress["current_state"] = data.get("state","")
     elif dtype == "category_resolved":
         app_state.progress["resolved_tasks"] += 1
         st=data.get("state",""); city=data.get("city",""); cat=data.get("category","")
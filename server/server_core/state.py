@@ -1,5 +1,6 @@
 """server/server_core/state.py — Global application state singleton."""
 import subprocess, asyncio
+from collections import deque
 from typing import Optional
 
 class AppState:
@@ -11,11 +12,11 @@ class AppState:
         self.pipeline = None; self.scan_running = False
         self.scan_task: Optional[asyncio.Task] = None
         self.vram_history = []; self.results = {}; self.resolution_status = {}
-        self.progress = {"total_states":50,"completed_states":0,"current_state":"","current_city":"",
+        self.progress = {"total_states":50,"completed_states":0,"current_state":"","active_states":[],"current_city":"",
             "current_category":"","total_tasks":450,"completed_tasks":0,"resolved_tasks":0,
             "failed_tasks":0,"started_at":None,"eta_seconds":None}
         # Query tracking
-        self.query_log = []
+        self.query_log = deque(maxlen=200)  # bounded FIFO, oldest evicted on append
         # ── Checkpoint system ──
         self.auto_mode = False          # True = skip all checkpoints, full auto
         self.checkpoint_name = ""       # e.g. "queries_ready", "search_done", "candidates_found"
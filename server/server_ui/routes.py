@@ -2,6 +2,7 @@
 import time, json, asyncio
 from pathlib import Path
 from datetime import datetime
+from itertools import islice
 from aiohttp import web
 from config.settings import MODELS, BASE_DIR
 from server.server_core.state import app_state
@@ -67,7 +68,8 @@ async def h_logs(req):
 
 async def h_queries(req):
     """Return recent query log for UI display."""
-    return web.json_response({"queries": app_state.query_log[-100:]})
+    ql = app_state.query_log
+    return web.json_response({"queries": list(islice(ql, max(0, len(ql) - 100), None))})
 
 # ── Saved models management ──
 SAVED_MODELS_FILE = BASE_DIR / "saved_models.json"
@@ -229,9 +231,15 @@ async def h_set_auto_mode(req):
 
 # ── Graph Scorer API ──
 
+_graph_scorer = None
+
 def _graph():
-    from pipeline.pipeline_core.graph_scorer import GraphScorer
-    return GraphScorer()
+    # One instance for the server: keeps its SQLite connection (and skips schema setup) across requests
+    global _graph_scorer
+    if _graph_scorer is None:
+        from pipeline.pipeline_core.graph_scorer import GraphScorer
+        _graph_scorer = GraphScorer()
+    return _graph_scorer
 
 async def h_graph_stats(req):
     return web.json_response(_graph().get_stats())
@@ -0,0 +1,25 @@
+"""utils/fast_json.py — orjson when installed, stdlib json otherwise.
+Same API both ways: dumps() -> UTF-8 bytes, loads() accepts bytes or str."""
+import json, os
+from pathlib import Path
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _OPTS = orjson.OPT_NON_STR_KEYS
+    def dumps(obj, default=str, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, default=default, option=_OPTS | orjson.OPT_INDENT_2 if indent else _OPTS)
+    loads = orjson.loads
+else:
+    def dumps(obj, default=str, indent: bool = False) -> bytes:
+        return json.dumps(obj, default=default, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+    loads = json.loads
+
+def write_atomic(path: Path, obj, indent: bool = False, default=str):
+    """Serialize obj to path via tmp file + os.replace: readers never see a half-written file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(dumps(obj, default=default, indent=indent))
+    os.replace(tmp, path)
@@ -1,11 +1,13 @@
 """utils/logger.py — Centralized logging with buffer for UI polling."""
 from datetime import datetime
 from typing import List
+from config.settings import LOG_DEBUG
 
 class Logger:
-    def __init__(self, max_entries=500):
+    def __init__(self, max_entries=500, debug=LOG_DEBUG):
         self.entries: List[str] = []
         self.max_entries = max_entries
+        self.debug_enabled = debug
     def log(self, msg: str):
         entry = f"[{datetime.now().strftime('%H:%M:%S')}] {msg}"
         self.entries.append(entry)
@@ -13,6 +15,9 @@ class Logger:
             self.entries = self.entries[-self.max_entries:]
         try: print(entry)
         except UnicodeEncodeError: print(entry.encode('ascii',errors='replace').decode('ascii'))
+    def debug(self, msg: str, *args):
+        """Detail line: %-formatted with args only when debug output is on."""
+        if self.debug_enabled: self.log(msg % args if args else msg)
     def get_recent(self, n=150): return self.entries[-n:]
     def clear(self): self.entries.clear()
 
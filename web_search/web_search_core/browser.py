@@ -302,11 +302,16 @@ class StealthBrowser:
 
     # ── Save page ──
 
+    async def get_page_content(self) -> str:
+        """Rendered HTML of the current page, without saving it."""
+        return await self.page.content()
+
     async def save_page_html(self, output_path: Path) -> Dict:
         """Save the current page as a clean single HTML file.
         
         Gets the fully rendered DOM (after JS execution), 
         inlines essential styles, removes scripts.
+        The cleaned HTML is also returned under "html" so callers can parse it without re-reading.
         """
         try:
             # Get the fully rendered HTML
@@ -326,7 +331,8 @@ class StealthBrowser:
             output_path.write_text(clean_html, encoding='utf-8')
 
             size_kb = output_path.stat().st_size / 1024
-            return {"success": True, "path": str(output_path), "size_kb": round(size_kb, 1), "title": title, "url": url}
+            return {"success": True, "path": str(output_path), "size_kb": round(size_kb, 1), "title": title, "url": url,
+                    "html": clean_html}
 
         except Exception as e:
             return {"success": False, "path": str(output_path), "error": str(e)[:200]}
@@ -10,7 +10,7 @@ Works with both Google and Brave Search HTML.
 import csv
 import re
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from html.parser import HTMLParser
 
 
@@ -96,8 +96,9 @@ class LinkExtractor(HTMLParser):
                 self.youtube_urls.add(m.group(1))
 
 
-def parse_search_html(html_path: str) -> Dict:
-    """Parse a saved search results HTML file.
+def parse_search_html(html_path: str = "", html: Optional[str] = None) -> Dict:
+    """Parse a saved search results HTML file, or pass `html=` to parse a page
+    already in memory (no disk read; an empty page just yields no links).
     
     Returns: {
         "links": [{"url", "title", "snippet", "domain"}],
@@ -106,14 +107,15 @@ def parse_search_html(html_path: str) -> Dict:
         "link_count": int,
     }
     """
-    path = Path(html_path)
-    if not path.exists():
-        return {"links": [], "youtube_urls": [], "full_text": "", "link_count": 0, "error": "File not found"}
-    
-    try:
-        html = path.read_text(encoding='utf-8', errors='replace')
-    except Exception as e:
-        return {"links": [], "youtube_urls": [], "full_text": "", "link_count": 0, "error": str(e)}
+    if html is None:
+        path = Path(html_path)
+        if not path.exists():
+            return {"links": [], "youtube_urls": [], "full_text": "", "link_count": 0, "error": "File not found"}
+
+        try:
+            html = path.read_text(encoding='utf-8', errors='replace')
+        except Exception as e:
+            return {"links": [], "youtube_urls": [], "full_text": "", "link_count": 0, "error": str(e)}
     
     # Parse with our extractor
     extractor = LinkExtractor()
@@ -176,6 +178,9 @@ def _enrich_with_snippets(links: List[Dict], html: str) -> List[Dict]:
     return links
 
 
+_PARSED_FIELDS = ("url", "title", "snippet", "domain", "is_youtube")
+
+
 def save_parsed_csv(html_path: str, parsed: Dict, output_csv: str = ""):
     """Save parsed results to a CSV file next to the HTML file.
     
@@ -184,36 +189,24 @@ def save_parsed_csv(html_path: str, parsed: Dict, output_csv: str = ""):
     if not output_csv:
         output_csv = str(Path(html_path).with_suffix('.csv'))
     
-    rows = []
-    for link in parsed.get("links", []):
-        is_yt = "youtube.com" in link.get("url", "")
-        rows.append({
-            "url": link.get("url", ""),
-            "title": link.get("title", ""),
-            "snippet": link.get("snippet", ""),
-            "domain": link.get("domain", ""),
-            "is_youtube": "yes" if is_yt else "",
-        })
+    # Tuples in column order + csv.writer: no per-row dict, no DictWriter key reordering
+    links = parsed.get("links", [])
+    rows = [(link.get("url", ""), link.get("title", ""), link.get("snippet", ""), link.get("domain", ""),
+             "yes" if "youtube.com" in link.get("url", "") else "")
+            for link in links]
     
     # Also add standalone YouTube URLs found in page but not in links
-    link_urls = set(l.get("url", "") for l in parsed.get("links", []))
+    link_urls = set(l.get("url", "") for l in links)
     for yt_url in parsed.get("youtube_urls", []):
         if yt_url not in link_urls:
-            rows.append({
-                "url": yt_url,
-                "title": "[YouTube channel found in page]",
-                "snippet": "",
-                "domain": "youtube.com",
-                "is_youtube": "yes",
-            })
+            rows.append((yt_url, "[YouTube channel found in page]", "", "youtube.com", "yes"))
     
     if not rows:
         return
     
-    fieldnames = ["url", "title", "snippet", "domain", "is_youtube"]
     with open(output_csv, "w", newline="", encoding="utf-8-sig") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+        writer = csv.writer(f)
+        writer.writerow(_PARSED_FIELDS)
         writer.writerows(rows)
 
 